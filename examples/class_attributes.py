@@ -0,0 +1,64 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# classes defined in Python, and `object` itself, get their trait methods as plain class attributes:
+# nothing hooks their attribute lookups, yet `traitor.stats` still sees the trait methods being used
+# run as `python examples/class_attributes.py [fallback|override]`
+
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+from traitor import get_slot  # noqa: E402
+
+
+def slot(ty):
+    return get_slot(ty, "__getattribute__").value
+
+
+native = slot(object)
+
+import traitor.stats  # noqa: E402
+from traitor.prelude import Debug, derive  # noqa: E402
+
+
+@derive(Debug)
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Plain:
+    def __init__(self):
+        self.value = 1
+
+
+# `Debug >> object` reaches every class without touching a single attribute slot
+assert slot(object) == slot(Point) == slot(Plain) == native
+assert "fmt" in Point.__dict__
+
+print(Point(1, 2).fmt())
+print(Plain().fmt().startswith("<__main__.Plain object"))
+
+# types with an impl of their own still get theirs rather than `object`'s
+print([1, (2, 3)].fmt())
+assert (5).fmt() == "5" and True.fmt() == "True"
+
+traitor.stats.enable()
+Point(3, 4).fmt()
+Plain().fmt()
+traitor.stats.disable()
+
+report = traitor.stats.report()
+print({label: row["trait_hits"] for label, row in report.items() if label[0] in ("Point", "Plain")})
+assert report[("Point", "fmt")]["trait"] == "Debug" and report[("Plain", "fmt")]["trait_hits"] == 1
+
+# once disabled, the class dicts hold the plain methods again
+assert type(Point.__dict__["fmt"]).__name__ == "function"
@@ -0,0 +1,88 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# nothing in the trait registry keeps a class alive: impls on classes created on the fly go away with them,
+# including `From`/`Into` impls and every parameterized trait built for them
+# run as `python examples/collected.py [fallback|override]`
+
+import gc
+import sys
+import weakref
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+from traitor import Trait, dyn  # noqa: E402
+from traitor.prelude import Debug, Default, derive, has_trait, impl  # noqa: E402
+from traitor.traits.into import From, Into  # noqa: E402
+
+
+class Describe(Trait):
+    def describe(self): ...
+
+
+def make():
+    @derive(Debug, Default)
+    class Celsius:
+        def __init__(self, value: int):
+            self.value = value
+
+    class Kelvin:
+        def __init__(self, value):
+            self.value = value
+
+    # every one of these methods refers back to the classes they're implemented for
+    @impl(From[Celsius] >> Kelvin)
+    class KelvinFromCelsius:
+        def from_(c):
+            return Kelvin(c.value + 273)
+
+    @impl(From[str] >> Kelvin)
+    class KelvinFromStr:
+        def from_(s):
+            return Kelvin(int(s))
+
+    @impl(From[Celsius] >> str)
+    class StrFromCelsius:
+        def from_(c):
+            return f"{c.value}C"
+
+    @impl(Describe >> Kelvin)
+    class DescribeKelvin:
+        def describe(self):
+            return f"{Kelvin.__name__} {self.value}"
+
+    # fill every cache a trait keeps per type
+    print(
+        Into[Kelvin](Celsius).into(Celsius(3)).describe(),
+        Into[str](Celsius).into(Celsius(2)),
+        Celsius(1).fmt().splitlines()[0],
+    )
+    print(
+        From[str](Kelvin).from_("5").describe(),
+        Describe.static("describe")(Kelvin(7)),
+        dyn(Describe, Kelvin(8)).describe(),
+    )
+    assert Default(Celsius).default().value == 0 and has_trait(Kelvin, From[Celsius])
+
+    # `impl` hands back the `TraitImpl`, the impl class itself is `.impl`. `StrFromCelsius` stays registered
+    # on `str` like any impl on a builtin, it just doesn't keep `Celsius` alive anymore
+    impls = (KelvinFromCelsius, KelvinFromStr, DescribeKelvin)
+
+    return [weakref.ref(ty) for ty in (Celsius, Kelvin, *(each.impl for each in impls))]
+
+
+refs = make()
+gc.collect()
+
+alive = [ref() for ref in refs if ref() is not None]
+print(f"{len(alive)} of {len(refs)} classes alive")
+assert not alive
+
+# the parameterized traits built for them went too, only the ones over `str` are left
+assert list(traitor.GENERIC_CACHE[From]) == list(traitor.GENERIC_CACHE[Into]) == [str]
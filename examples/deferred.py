@@ -0,0 +1,71 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# with deferred hooks, impls on builtin types are only recorded when registered: a type is hooked the first
+# time one of its trait methods is looked up, and every other type keeps its native attribute access
+# run as `python examples/deferred.py [fallback|override]`
+
+import gc
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+traitor.set_deferred_hooks()
+
+from traitor import get_slot, subclasses  # noqa: E402
+
+
+def slots():
+    return {ty: get_slot(ty, "__getattribute__").value for ty in subclasses(object)}
+
+
+gc.collect()
+before = slots()
+
+from traitor import Trait  # noqa: E402
+from traitor.prelude import AdvancedIterator, Debug, has_trait, impl  # noqa: E402
+
+# nothing is hooked yet, not even `object`
+after = slots()
+assert not [ty for ty in before if after[ty] != before[ty]]
+assert list in traitor.PENDING and has_trait(list, AdvancedIterator)
+
+print([1, 2, 3].map(lambda x: x * 2).collect())
+
+# `list` got its hooks on first use, the other types are still pending
+assert list not in traitor.PENDING and str in traitor.PENDING
+assert get_slot(str, "__getattribute__").value == before[str]
+
+
+class Greet(Trait):
+    def greet(self):
+        return f"hi from {type(self).__name__}"
+
+
+@impl(Greet >> int)
+class GreetInt:
+    pass
+
+
+@impl(Greet >> bool)
+class GreetBool:
+    pass
+
+
+# hooking `int` leaves `bool`'s own impl pending, it still takes over once `int`'s is gone
+print((5).greet())
+assert bool in traitor.PENDING
+
+traitor.remove_impl(Greet, int)
+print(True.greet())
+assert not hasattr(5, "greet")
+
+traitor.install_deferred()
+print(len(traitor.PENDING), "pending,", (1.5).fmt())
+assert not traitor.PENDING and has_trait(float, Debug)
@@ -0,0 +1,106 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# defaults copied into an impl for a builtin type get their `self.<method>()` calls bound to that impl the
+# first time they're used; the bound call has to step aside whenever a plain lookup would find something else
+# run as `python examples/devirtualize.py [fallback|override]`
+
+import sys
+from inspect import isroutine
+from types import FunctionType
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+from traitor import AmbiguousMethodError, Trait, impl, remove_impl  # noqa: E402
+
+
+class Shape(Trait):
+    def sides(self): ...
+
+    def describe(self):
+        return f"{self.sides()} sides"
+
+
+@impl(Shape >> tuple)
+class ShapeTuple:
+    def sides(self):
+        return len(self)
+
+
+print((1, 2, 3).describe())
+assert (1, 2, 3).describe() == "3 sides"
+
+# the default really was rewritten, so the cases below go through the bound call
+assert "__impl_sides" in Shape(tuple).describe.__code__.co_freevars
+
+# looked up on the impl or the type, a default is a plain function
+assert type(Shape(tuple).describe) is FunctionType
+
+with traitor.type_hook():
+    assert isroutine(tuple.describe)
+
+# a default without source to rewrite is used as it is
+namespace = {"Trait": Trait}
+exec(
+    compile(
+        "class Named(Trait):\n    def name(self): ...\n\n    def greet(self):\n        return f'hi {self.name()}'\n",
+        "<generated>",
+        "exec",
+    ),
+    namespace,
+)
+Named = namespace["Named"]
+
+
+@impl(Named >> range)
+class NamedRange:
+    def name(self):
+        return "range"
+
+
+print(range(3).greet())
+assert range(3).greet() == "hi range" and Named(range).greet.__code__.co_filename == "<generated>"
+
+
+# a native override on a subclass wins over the impl the call was bound to
+class Square(tuple):
+    def sides(self):
+        return 4
+
+
+print(Square().describe())
+assert Square().describe() == "4 sides"
+
+
+# another trait providing `sides` for tuple makes the call ambiguous, already bound or not
+class Polygon(Trait):
+    def sides(self): ...
+
+
+@impl(Polygon >> tuple)
+class PolygonTuple:
+    def sides(self):
+        return 0
+
+
+try:
+    (1, 2, 3).describe()
+
+except AmbiguousMethodError as e:
+    print(str(e).splitlines()[0])
+
+else:
+    raise AssertionError("`sides` should be ambiguous on tuple")
+
+assert Square().describe() == "4 sides"
+
+remove_impl(Polygon, tuple)
+
+print((1, 2, 3).describe())
+assert (1, 2, 3).describe() == "3 sides"
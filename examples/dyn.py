@@ -0,0 +1,72 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# `dyn(Trait, value)` is a handle on `value` with every method of `Trait` resolved up front: the vtable is built once
+# per (trait, type) and shared by every handle, methods are bound into the handle's slots on first use
+# run as `python examples/dyn.py [fallback|override]`
+
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+from traitor import Trait, dyn, impl  # noqa: E402
+
+
+class Shape(Trait):
+    def area(self): ...
+
+    def describe(self):
+        return f"{type(self).__name__} of area {self.area()}"
+
+
+@impl(Shape >> int)
+class ShapeInt:
+    def area(self):
+        return self * self
+
+
+class Circle:
+    def __init__(self, r):
+        self.r = r
+
+    # not part of the trait, a handle doesn't expose it
+    def perimeter(self):
+        return 6.28 * self.r
+
+
+@impl(Shape >> Circle)
+class ShapeCircle:
+    def area(self):
+        return 3.14 * self.r * self.r
+
+
+shapes = [dyn(Shape, value) for value in (2, 3, Circle(1))]
+
+print([shape.describe() for shape in shapes])
+print(shapes[0])
+
+# one handle class per trait, one vtable per concrete type
+assert type(shapes[0]) is type(shapes[2]) and type(shapes[0]).__name__ == "dyn Shape"
+assert shapes[0]._Dyn__vtable is shapes[1]._Dyn__vtable is not shapes[2]._Dyn__vtable
+
+# the first read bound the method into the handle, it's a plain slot from then on
+area = shapes[1].area
+assert area is shapes[1].area and area.__self__ == 3
+
+for name in ("perimeter", "r"):
+    assert not hasattr(shapes[2], name)
+
+try:
+    dyn(Shape, "square")
+
+except TypeError as e:
+    print(e)
+
+else:
+    raise AssertionError("str has no Shape impl")
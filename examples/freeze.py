@@ -0,0 +1,84 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# `freeze()` compiles every hooked type's trait methods into one flat table and locks the registry until `thaw()`
+# run as `python examples/freeze.py [fallback|override] [deferred]`
+
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+if len(sys.argv) > 2:
+    traitor.set_deferred_hooks(True)
+
+from traitor import AmbiguousMethodError, Trait, impl, sentinel_of  # noqa: E402
+from traitor.prelude import AdvancedIterator  # noqa: E402
+
+
+class Greet(Trait):
+    def greet(self):
+        return f"hi from {type(self).__name__}"
+
+
+class Wave(Trait):
+    def greet(self):
+        return "*waves*"
+
+
+@impl(Greet >> int)
+class GreetInt:
+    pass
+
+
+@impl(Wave >> bool)
+class WaveBool:
+    pass
+
+
+@impl(Greet >> bool)
+class GreetBool:
+    pass
+
+
+traitor.freeze()
+
+# deferred impls are installed first, every hooked type dispatches through its compiled table
+assert not traitor.PENDING
+assert type(sentinel_of(int)) is type(sentinel_of(list)) is traitor.FrozenMethodSentinel
+
+print((5).greet(), [1, 2, 3].map(lambda x: x + 1).collect(), AdvancedIterator(range).collect(range(2)))
+
+# ambiguity was resolved once at freeze time, and still raises where it did before
+try:
+    True.greet()
+
+except AmbiguousMethodError as e:
+    print(str(e).splitlines()[0])
+
+else:
+    raise AssertionError("`greet` should be ambiguous on bool")
+
+# a frozen registry can't change
+for change in (lambda: impl(Wave >> int)(GreetInt), lambda: traitor.remove_impl(Greet, int)):
+    try:
+        change()
+
+    except RuntimeError as e:
+        print(e)
+
+    else:
+        raise AssertionError("the registry should be frozen")
+
+traitor.thaw()
+
+assert type(sentinel_of(int)) is traitor.MethodSentinel
+
+traitor.remove_impl(Wave, bool)
+print(True.greet())
+assert True.greet() == "hi from bool"
@@ -0,0 +1,76 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# `impl_many(Trait, types, Impl)` implements a trait for a whole family of types with one impl class:
+# coverage is checked and the defaults copied once, and each type still gets an impl it can drop on its own
+# run as `python examples/impl_many.py [fallback|override] [deferred]`
+
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+if len(sys.argv) > 2:
+    traitor.set_deferred_hooks(True)
+
+from traitor import Trait, remove_impl  # noqa: E402
+from traitor.prelude import has_trait, impl_many, implementors  # noqa: E402
+
+
+class Size(Trait):
+    def size(self): ...
+
+    def is_empty(self):
+        return self.size() == 0
+
+
+class Sized:
+    def size(self):
+        return len(self)
+
+
+class Stack(list):
+    pass
+
+
+impls = impl_many(Size, [list, tuple, dict, Stack], Sized)
+
+print([impl.target.__name__ for impl in impls], (1, 2).size(), {}.is_empty(), Stack([3]).size())
+
+# one impl class behind all of them
+assert all(impl.impl is Sized for impl in impls) and Size(tuple) is Size(Stack) is Sized
+assert implementors(Size) == {list, tuple, dict, Stack}
+
+# coverage is checked before anything is registered
+try:
+    impl_many(Size, [str, bytes], type("Empty", (), {}))
+
+except RuntimeError as e:
+    print(str(e).splitlines()[0])
+
+else:
+    raise AssertionError("`size` is required")
+
+assert not has_trait(str, Size)
+
+
+class Greet(Trait):
+    def greet(self):
+        return f"hello from {type(self).__name__}"
+
+
+# leaving the impl out uses the trait's defaults alone
+impl_many(Greet, [int, float, Stack])
+
+print((1).greet(), (2.5).greet(), Stack().greet())
+
+# each type's impl can still be removed on its own
+remove_impl(Size, tuple)
+
+assert not has_trait((), Size) and [].size() == 0 and {"a": 1}.size() == 1
+assert implementors(Size) == {list, dict, Stack}
@@ -0,0 +1,92 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# impls are resolved along the MRO: subclasses inherit their bases' impls, and the nearest one wins
+# run as `python examples/inheritance.py [fallback|override] [deferred]`
+
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+if len(sys.argv) > 2:
+    traitor.set_deferred_hooks(True)
+
+from traitor import Trait, has_trait, impl, remove_impl  # noqa: E402
+
+
+class Name(Trait):
+    def name(self): ...
+
+    def shout(self):
+        return self.name().upper()
+
+
+class Animal:
+    pass
+
+
+class Dog(Animal):
+    pass
+
+
+class Puppy(Dog):
+    pass
+
+
+class Pet:
+    pass
+
+
+class Cat(Pet, Animal):
+    pass
+
+
+class Count(int):
+    pass
+
+
+@impl(Name >> Animal)
+class NameAnimal:
+    def name(self):
+        return "animal"
+
+
+@impl(Name >> Dog)
+class NameDog:
+    def name(self):
+        return "dog"
+
+
+@impl(Name >> Pet)
+class NamePet:
+    def name(self):
+        return "pet"
+
+
+@impl(Name >> int)
+class NameInt:
+    def name(self):
+        return f"int {self}"
+
+
+print(Puppy().shout(), Cat().name(), Count(3).name(), True.name())
+
+# `Dog`'s impl is nearer to `Puppy` than `Animal`'s, and `Pet` comes before `Animal` in `Cat`'s MRO
+assert Name(Puppy) is NameDog.impl and Name(Cat) is NamePet.impl
+assert Name(Count) is Name(bool) is NameInt.impl
+assert has_trait(Puppy(), Name) and has_trait(Count, Name)
+
+# with the nearest impl gone, the next one along the MRO takes over
+remove_impl(Name, Dog)
+
+print(Puppy().name())
+assert Name(Puppy) is NameAnimal.impl and Puppy().shout() == "ANIMAL"
+
+remove_impl(Name, Animal)
+assert not has_trait(Puppy, Name) and Cat().name() == "pet"
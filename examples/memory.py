@@ -0,0 +1,71 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# `memory_report()` sizes the trait registry; classes created on the fly show up in it while they're alive
+# and drop out of it once they're collected
+# run as `python examples/memory.py [fallback|override]`
+
+import gc
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+from traitor import Trait, memory_report  # noqa: E402
+from traitor.prelude import Debug, Default, derive, impl  # noqa: E402
+
+
+class Label(Trait):
+    def label(self): ...
+
+
+def make(n):
+    classes = []
+
+    for i in range(n):
+
+        @derive(Debug, Default)
+        class Row:
+            def __init__(self, value: int):
+                self.value = value
+
+        @impl(Label >> Row)
+        class LabelRow:
+            def label(self):
+                return f"row {self.value}"
+
+        # resolve everything once so each class has its caches filled
+        row = Default(Row).default()
+        assert row.label() == "row 0" and row.fmt()
+        classes.append(Row)
+
+    return classes
+
+
+keys = ("hooked_types", "impls", "methods", "cached_resolutions")
+
+# the first run also caches what the rows' fields resolve to, builtins stay in the registry for good
+make(1)
+gc.collect()
+before = memory_report()
+
+rows = make(50)
+during = memory_report()
+
+print({key: (before[key], during[key]) for key in keys})
+assert during["hooked_types"] == before["hooked_types"] + 50
+assert during["impls"] == before["impls"] + 150
+assert during["cached_resolutions"] > before["cached_resolutions"]
+
+del rows
+gc.collect()
+after = memory_report()
+
+# everything that was there for the transient classes is gone
+print({key: after[key] for key in keys}, f"{after['sentinel_bytes']} sentinel bytes")
+assert all(after[key] == before[key] for key in keys)
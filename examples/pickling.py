@@ -0,0 +1,72 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# impls built at runtime by derives (and `From`'s reciprocal `Into`) pickle as a reference to the impl they are:
+# unpickled in a process that never registered it, the impl is derived there again
+# run as `python examples/pickling.py [fallback|override]`
+
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+from traitor.prelude import Debug, Default, derive, has_trait, impl  # noqa: E402
+from traitor.traits.colored import Colorize  # noqa: E402
+from traitor.traits.into import From, Into  # noqa: E402
+
+
+class Point:
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+    def __str__(self):
+        return f"({self.x}, {self.y})"
+
+
+class PointFromStr:
+    def from_(value):
+        return Point(*map(int, value.split(",")))
+
+
+# only the main process runs this, workers just import the module
+def register():
+    derive(Debug, Default, Colorize)(Point)
+    impl(From[str] >> Point)(PointFromStr)
+
+
+def derived() -> tuple:
+    return Debug(Point), Default(Point), Colorize(Point), Into[Point](str)
+
+
+def worker(payload: bytes):
+    assert not has_trait(Point, Default) and not has_trait(str, Into[Point])
+
+    impls = pickle.loads(payload)
+    assert impls == derived() and has_trait(str, Into[Point])
+
+    return [impl.__name__ for impl in impls], Point(1, 2).fmt().splitlines()[0], Default(Point).default().x
+
+
+if __name__ == "__main__":
+    register()
+
+    # within one process a round trip gives back the very same objects
+    for obj in (From[str], Into[Point], *derived()):
+        assert pickle.loads(pickle.dumps(obj)) is obj
+
+    print(f"{'1,2'.into().bold()!s}", Into[Point].into("3,4").fmt().splitlines()[1])
+
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+        names, header, x = pool.submit(worker, pickle.dumps(derived())).result()
+
+    print(names, header, x)
+    assert names == [impl.__name__ for impl in derived()]
@@ -0,0 +1,81 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# asking which types implement a trait: `has_trait` and `has_trait_many` resolve through base classes and
+# remember the answer per type, `implementors` lists the types a trait was implemented on
+# run as `python examples/queries.py [fallback|override] [deferred]`
+
+import gc
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+if len(sys.argv) > 2:
+    traitor.set_deferred_hooks(True)
+
+from traitor import Trait, remove_impl  # noqa: E402
+from traitor.prelude import has_trait, has_trait_many, impl, implementors  # noqa: E402
+
+
+class Area(Trait):
+    def area(self): ...
+
+
+class Square:
+    def __init__(self, side):
+        self.side = side
+
+
+class Tile(Square):
+    pass
+
+
+@impl(Area >> Square)
+class AreaSquare:
+    def area(self):
+        return self.side**2
+
+
+@impl(Area >> float)
+class AreaFloat:
+    def area(self):
+        return self
+
+
+# types and instances alike, subclasses through their base
+assert has_trait(Square, Area) and has_trait(Tile(2), Area) and has_trait(bool, Area) is False
+print(has_trait_many([Tile(1), 2.5, "3", Square, 4], Area))
+
+# only the types the impls were registered on, not their subclasses
+print(sorted(ty.__name__ for ty in implementors(Area)))
+assert implementors(Area) == {Square, float}
+
+# a deferred impl counts without hooking its type
+if traitor.DEFER_HOOKS:
+    assert has_trait(1.5, Area) and float in traitor.PENDING
+
+# answers follow the registry as it changes
+remove_impl(Area, Square)
+assert not has_trait(Tile, Area) and implementors(Area) == {float}
+
+
+def transient():
+    class Circle:
+        pass
+
+    impl(Area >> Circle)(AreaFloat.impl)
+    assert Circle in implementors(Area)
+
+
+# a class that's gone is no longer listed
+transient()
+gc.collect()
+
+print(sorted(ty.__name__ for ty in implementors(Area)))
+assert implementors(Area) == {float}
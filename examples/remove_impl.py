@@ -0,0 +1,108 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# once the last impl on a type is removed its hooks come out, and every class the attribute slot was copied into
+# gets its own back: subclasses, classes with hooks of their own, and native types like `super`
+# run as `python examples/remove_impl.py [fallback|override] [deferred]`
+
+import gc
+import sys
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+if len(sys.argv) > 2:
+    traitor.set_deferred_hooks(True)
+
+from traitor import Trait, get_slot, impl, remove_impl, subclasses  # noqa: E402
+
+
+def slots():
+    return {ty: get_slot(ty, "__getattribute__").value for ty in subclasses(object)}
+
+
+class Greet(Trait):
+    def greet(self):
+        return f"hi from {type(self).__name__}"
+
+
+class Point:
+    def __init__(self):
+        self.x = 1
+
+
+class Point3(Point):
+    pass
+
+
+class Number(int):
+    pass
+
+
+# leftover throwaway classes would only add noise
+gc.collect()
+before = slots()
+
+
+@impl(Greet >> int)
+class GreetInt:
+    pass
+
+
+# bool is hooked on top of its already hooked base
+@impl(Greet >> bool)
+class GreetBool:
+    pass
+
+
+@impl(Greet >> Point)
+class GreetPoint:
+    pass
+
+
+print((5).greet(), True.greet(), Number(3).greet(), Point3().greet())
+
+remove_impl(Greet, int)
+
+assert True.greet() == "hi from bool"
+assert not hasattr(5, "greet") and not hasattr(Number(3), "greet")
+
+remove_impl(Greet, bool)
+
+
+# an impl on `object` is copied into every class there is
+@impl(Greet >> object)
+class GreetObject:
+    pass
+
+
+print(Point3().greet(), Point3().x)
+
+remove_impl(Greet, object)
+remove_impl(Greet, Point)
+
+assert not hasattr(Point3(), "greet")
+
+
+# `super` has its own slot, a wrong one would break class creation
+class Base:
+    def __init_subclass__(cls):
+        cls.created = True
+
+
+class Derived(Base):
+    pass
+
+
+assert Derived.__dict__.get("created")
+
+after = slots()
+changed = [ty.__qualname__ for ty in before if after[ty] != before[ty]]
+
+print(f"{len(before)} classes, slots changed: {changed}")
+assert not changed
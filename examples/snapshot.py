@@ -0,0 +1,94 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# a snapshot keeps introspection results per source file: editing a file only drops its own entries,
+# and a snapshot written by another version of traitor isn't loaded at all
+# run as `python examples/snapshot.py [fallback|override]`
+
+import json
+import os
+import sys
+import tempfile
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+from traitor import snapshot  # noqa: E402
+
+SHAPES = """
+from traitor import Trait
+
+class Shape(Trait):
+    def area(self): ...
+
+    def describe(self):
+        return f"area {self.area()}"
+"""
+
+SQUARES = """
+from traitor import impl
+from shapes import Shape
+
+class Square:
+    def __init__(self, side):
+        self.side = side
+
+@impl(Shape >> Square)
+class ShapeSquare:
+    def area(self):
+        return self.side ** 2
+"""
+
+
+def write(path, source):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+
+
+# a fresh process would start without any hashes of its own
+def reload(path):
+    snapshot.FILE_HASHES.clear()
+
+    return snapshot.load(path)
+
+
+with tempfile.TemporaryDirectory() as root:
+    shapes, squares, path = (os.path.join(root, name) for name in ("shapes.py", "squares.py", "snapshot.json"))
+    write(shapes, SHAPES)
+    write(squares, SQUARES)
+    sys.path.insert(0, root)
+
+    assert not snapshot.load(path)
+
+    from squares import Square  # noqa: E402
+
+    print(Square(3).describe())
+    snapshot.save(path)
+
+    assert reload(path) and set(snapshot.ACTIVE) == {shapes, squares}
+    print(snapshot.impl_map())
+
+    # what the next import of `shapes` will be served instead of introspecting `Shape` again
+    assert list(snapshot.ACTIVE[shapes]["trait_methods"].values()) == [(("area",), ("describe",))]
+
+    # only the edited file's entries go
+    write(squares, SQUARES.replace("** 2", "* self.side"))
+
+    assert reload(path) and set(snapshot.ACTIVE) == {shapes}
+
+    # a snapshot from another version is ignored as a whole
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    data["version"] = snapshot.VERSION + 1
+    write(path, json.dumps(data))
+
+    assert not reload(path) and snapshot.ACTIVE == {} and snapshot.impl_map() == []
+    print("stale entries dropped")
+
+    sys.path.remove(root)
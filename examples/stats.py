@@ -0,0 +1,83 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# `traitor.stats` counts the lookups that reach traitor's hooks while enabled, and writes them out for `pstats`
+# run as `python examples/stats.py [fallback|override]`
+
+import os
+import pstats
+import sys
+import tempfile
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+import traitor.stats  # noqa: E402
+from traitor import Trait, impl, sentinel_of  # noqa: E402
+
+
+class Double(Trait):
+    def double(self): ...
+
+
+@impl(Double >> int)
+class DoubleInt:
+    def double(self):
+        return self * 2
+
+
+class Money:
+    def __init__(self, cents):
+        self.cents = cents
+
+
+@impl(Double >> Money)
+class DoubleMoney:
+    def double(self):
+        return Money(self.cents * 2)
+
+
+# `Money` gets its trait methods as class attributes, `int` is only reachable through the hooks
+assert isinstance(sentinel_of(Money), traitor.ClassAttributeSentinel)
+
+(3).double()  # not counted, stats are off
+
+traitor.stats.enable(timing=True, sample=2)
+
+for i in range(10):
+    i.double()
+
+Money(5).double().double()
+
+traitor.stats.disable()
+
+(3).double()  # not counted either
+
+report = traitor.stats.report()
+
+for key, row in report.items():
+    print(key, row)
+
+# the busiest lookup comes first, with the trait that provided it
+assert next(iter(report)) == ("int", "double")
+assert report[("int", "double")]["trait_hits"] == 10 and report[("int", "double")]["trait"] == "Double"
+assert report[("int", "double")]["seconds"] is not None
+assert report[("Money", "double")]["trait_hits"] == 2
+
+with tempfile.TemporaryDirectory() as root:
+    path = os.path.join(root, "dispatch.prof")
+    traitor.stats.dump(path)
+
+    # one entry per (type, attribute), as (file, line, function)
+    stats = pstats.Stats(path)
+    assert stats.stats[("int", 0, "double")][0] == 10
+
+    stats.sort_stats("calls").print_stats(5)
+
+traitor.stats.reset()
+assert traitor.stats.report() == {}
@@ -0,0 +1,80 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+# type: ignore
+
+# `traitor.trace()` records the trait methods resolved inside the block and their calls, as Chrome trace events
+# or as a file `pstats` reads; the hooks themselves show up under their type's name in any profiler
+# run as `python examples/trace.py [fallback|override]`
+
+import cProfile
+import json
+import os
+import pstats
+import sys
+import tempfile
+
+import traitor
+
+if len(sys.argv) > 1:
+    traitor.set_hook_mode(sys.argv[1])
+
+from traitor import Trait, impl  # noqa: E402
+
+
+class Shout(Trait):
+    def shout(self): ...
+
+
+@impl(Shout >> str)
+class ShoutStr:
+    def shout(self):
+        return self.upper() + "!"
+
+
+class Word:
+    def __init__(self, text):
+        self.text = text
+
+
+@impl(Shout >> Word)
+class ShoutWord:
+    def shout(self):
+        return self.text.shout()
+
+
+with tempfile.TemporaryDirectory() as root:
+    chrome, prof = os.path.join(root, "dispatch.json"), os.path.join(root, "dispatch.prof")
+
+    with traitor.trace(chrome) as tracer:
+        print(Word("hey").shout(), Shout(str))
+
+    with open(chrome, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+
+    # every resolution and every call, with the type and trait it went through
+    sites = {(event["cat"], event["args"]["type"], event["args"]["trait"], event["name"]) for event in events}
+    print(*sorted(sites), sep="\n")
+
+    assert ("call", "Word", "Shout", "Shout.shout") in sites and ("call", "str", "Shout", "Shout.shout") in sites
+    assert ("resolve", "str", "Shout", "Shout.<impl>") in sites
+
+    with traitor.trace(prof, format="pstats"):
+        for word in ("a", "b", "c"):
+            Word(word).shout()
+
+    stats = pstats.Stats(prof).stats
+    assert stats[("Shout [ShoutWord for Word]", 0, "shout")][0] == 3
+
+# outside of a trace nothing is recorded
+Word("quiet").shout()
+assert len(tracer.events) == len(events)
+
+# the hooks are named after the type they're installed on
+profile = cProfile.Profile()
+profile.runcall(lambda: "hooked".shout())
+
+hooks = [name for _, _, name in pstats.Stats(profile).stats if name.startswith("<traitor")]
+print(hooks)
+assert hooks and all(name.endswith(" of str>") for name in hooks)
@@ -6,22 +6,76 @@ from __future__ import annotations
 
 # __all__ = ("impl", "derive", "Trait", "has_trait")
 
-import operator
+import atexit
+import copyreg
+import sys
+import threading
 import types
+from collections import deque
+from contextlib import contextmanager
+from ctypes import c_void_p, py_object, pythonapi, sizeof
+from dis import get_instructions
 from functools import wraps
 from inspect import getmembers, isroutine
+from types import MappingProxyType
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary, finalize, ref
 
+import fishhook
 from fishhook import hook
 
-NO_BODY_FUNCTION_CODE = b"d\x00S\x00"
+from . import inline, snapshot
+
+# code object -> whether the function body is empty (`...`, `pass` or just a docstring)
+EMPTY_BODIES = WeakKeyDictionary()
+# bookkeeping the compiler emits around any body, it says nothing about what the function does
+PROLOGUE_OPS = frozenset(("RESUME", "NOP", "CACHE", "EXTENDED_ARG", "COPY_FREE_VARS", "MAKE_CELL"))
 GET_ATTRIBUTE = type.__getattribute__
+HEAP_TYPE = 1 << 9  # Py_TPFLAGS_HEAPTYPE
+IMMUTABLE_TYPE = 1 << 8  # Py_TPFLAGS_IMMUTABLETYPE
 OBJ_GET_ATTRIBUTE = object.__getattribute__
 
-GENERIC_CACHE = {}
+# Registry writers serialize on this lock and publish fresh dicts instead of mutating
+# the ones readers may be holding, so dispatch never has to lock
+REGISTRY_LOCK = threading.RLock()
+
+# origin -> {argument type: parameterized trait}, an entry goes with its argument type and never keeps it alive
+GENERIC_CACHE = WeakKeyDictionary()
+# (origin, argument) for arguments that can't be weakly referenced (`Trait[int, str]`): these live as long
+# as something uses them, the most recent few are kept regardless
+GENERIC_VALUES = WeakValueDictionary()
+GENERIC_KEEPALIVE = deque(maxlen=128)
+# Nothing here keeps a class alive: a hooked type and its sentinel only reference each other,
+# so classes created on the fly are collected along with their impls
+# every type carrying a sentinel, the sentinel itself lives in the type's `__dict__`
+SENTINELS = WeakSet()
+# trait -> WeakSet of the types it was implemented on, subclasses of those inherit it
+IMPLEMENTORS = WeakKeyDictionary()
+# every name some impl provides a method under, anything else is looked up natively without touching a sentinel's cache
+METHOD_NAMES = set()
+# every call site statically bound by `inline`, emptied whenever a resolution may have changed
+INLINE_CACHES = WeakSet()
+# hook function -> weakref to the sentinel it calls
+SENTINEL_WRAPPERS = WeakKeyDictionary()
+FROZEN = False
+
+# type -> {trait: impl} recorded while hooks are deferred, installed on first lookup (see `PendingMethod`)
+PENDING = WeakKeyDictionary()
+DEFER_HOOKS = False
+
+HOOK_MODES = ("fallback", "override")
+HOOK_MODE = "fallback"
+
+# (hooked name, original slot) while the type-level hook is installed
+TYPE_HOOK = None
+# opt-in, see `enable_type_hook`: the hook slows down every class attribute read
+TYPE_HOOK_AUTO = False
 
 @type.__call__
 class NULL: ...
 
+@type.__call__
+class NATIVE: ...
+
 def HAS_ATTRIBUTE(obj, key):
     try:
         return GET_ATTRIBUTE(obj, key)
@@ -36,81 +90,829 @@ def OBJ_HAS_ATTRIBUTE(obj, key):
     except:
         return NULL
 
+def HAS_NATIVE(native, obj, key):
+    try:
+        return native(obj, key)
+
+    except AttributeError:
+        return NULL
+
+
+def native_getattribute(target: type):
+    method = GET_ATTRIBUTE(target, "__getattribute__")
+
+    # skip over sentinel wrappers installed on a base class
+    while method in SENTINEL_WRAPPERS:
+        method = SENTINEL_WRAPPERS[method]().native
+
+    return method
+
+
+def mro_lookup(target: type, name: str):
+    for base in target.__mro__:
+        if name in (attrs := GET_ATTRIBUTE(base, "__dict__")):
+            return attrs[name]
+
+    return NULL
+
+
+# fishhook can't restore a slot without touching subclasses, and can't unhook `type` at all
+def get_slot(cls: type, name: str):
+    return next(fishhook.getptrs(cls, fishhook.generate_slotmap()[name]))
+
+
+# The slots CPython uses for attribute hooks written in Python: `slot_tp_getattr_hook`, and `slot_tp_getattro`
+# that it demotes itself to on first use when there's no `__getattr__` to go with the `__getattribute__`
+def python_getattr_slots():
+    class Probe:
+        def __getattribute__(self, name):
+            return object.__getattribute__(self, name)
+
+    hook = get_slot(Probe, "__getattribute__").value
+
+    # any lookup on an instance demotes it
+    Probe().__class__
+
+    return hook, get_slot(Probe, "__getattribute__").value
+
+
+PYTHON_GETATTR_SLOTS = python_getattr_slots()
+
+
+# Hooks reached through `slot_tp_getattr_hook` are bound with `__get__`, which leaves functions
+# unbound for `None`, so they take `(o, k=NULL)` and shift a lone argument into `k`
+def hook_fallback(cls: type, body: dict):
+    hook(cls)(body=dict(body))
+
+    # any lookup made while the slot is copied but before `__getattr__` lands in the type dict
+    # demotes the slot to plain `__getattribute__` dispatch, so copy it again now the dict is populated
+    hook(cls, is_base=False)(body=dict(body))
+
+
+def remove_hook(cls: type, name: str, slot: int | None = None, original=NULL):
+    if original is NULL:
+        del fishhook.getdict(cls)[name]
+
+    else:
+        fishhook.getdict(cls)[name] = original
+
+    fishhook.hooks.discard(f"{id(cls)}.{name}")
+    fishhook.methods_cache.pop(f"{id(cls)}.{name}", None)
+
+    if slot is not None:
+        get_slot(cls, name).value = slot
+
+    pythonapi.PyType_Modified(py_object(cls))
+
+
+# `type.__setattr__` and `type.__delattr__`, for builtins that refuse them too. Their slots are left as they are
+def set_class_attribute(cls: type, name: str, value):
+    try:
+        type.__setattr__(cls, name, value)
+
+    except TypeError:
+        fishhook.getdict(cls)[name] = value
+        pythonapi.PyType_Modified(py_object(cls))
+
+
+def delete_class_attribute(cls: type, name: str):
+    try:
+        type.__delattr__(cls, name)
+
+    except TypeError:
+        del fishhook.getdict(cls)[name]
+        pythonapi.PyType_Modified(py_object(cls))
+
+
+# The C function a slot wrapper calls, `d_wrapped` is the last field of a wrapper descriptor
+WRAPPED_OFFSET = types.WrapperDescriptorType.__basicsize__ - sizeof(c_void_p)
+
+
+def wrapped_slot(descriptor):
+    return c_void_p.from_address(id(descriptor) + WRAPPED_OFFSET).value
+
+
+# Put the attribute slot of `cls` back to `slot` (as read from a `c_void_p`), along with every subclass the hook
+# was copied into. Subclasses with hooks of their own (and everything below them) are left alone
+def restore_getattr_slot(cls: type, slot: int | None):
+    hooked = get_slot(cls, "__getattribute__").value
+    todo = [(cls, slot)]
+
+    while todo:
+        ty, slot = todo.pop()
+
+        get_slot(ty, "__getattribute__").value = slot
+        pythonapi.PyType_Modified(py_object(ty))
+
+        for sub in type.__subclasses__(ty):
+            attrs = GET_ATTRIBUTE(sub, "__dict__")
+
+            # class attribute sentinels hook nothing, their classes only inherited the slot
+            if "__sentinel" in attrs and not isinstance(attrs["__sentinel"], ClassAttributeSentinel):
+                continue
+
+            # slots are inherited from `__base__` alone, other bases don't count
+            if GET_ATTRIBUTE(sub, "__base__") is not ty:
+                continue
+
+            if (current := get_slot(sub, "__getattribute__").value) != hooked and current not in PYTHON_GETATTR_SLOTS:
+                continue
+
+            # static types carry their native slots as wrapper descriptors, anything else is user code
+            if any(name in attrs and type(attrs[name]) is not types.WrapperDescriptorType for name in ("__getattr__", "__getattribute__")):
+                continue
+
+            # fishhook copies the hook over those native slots too (`super`, `module`, ...), they get their own back
+            todo.append((sub, wrapped_slot(attrs["__getattribute__"]) if "__getattribute__" in attrs else slot))
+
+
+# Binds already-bound providers (classmethods on the trait, mostly) so the instance is passed as the first argument
+class TraitMethod:
+    __slots__ = ("method",)
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, method):
+        self.method = method
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.method
+
+        return types.MethodType(self.method, instance)
+
+    def __repr__(self):
+        return f"TraitMethod<{self.method!r}>"
+
+
+# Required trait methods are the ones declared without a body, so ask the bytecode rather than
+# matching it byte for byte, which only ever fits one interpreter's layout
+def has_empty_body(code: types.CodeType) -> bool:
+    try:
+        return EMPTY_BODIES[code]
+
+    except KeyError:
+        ops = [
+            (instr.opname, instr.argval)
+            for instr in get_instructions(code)
+            if instr.opname not in PROLOGUE_OPS
+        ]
+
+        empty = EMPTY_BODIES[code] = ops in ([("LOAD_CONST", None), ("RETURN_VALUE", None)], [("RETURN_CONST", None)])
+
+        return empty
+
+
+# The sentinel installed on `ty` itself, not one inherited from a base
+def sentinel_of(ty: type):
+    attrs = GET_ATTRIBUTE(ty, "__dict__")
+
+    return attrs["__sentinel"] if "__sentinel" in attrs else NULL
+
+
+def installed_sentinels() -> list:
+    return [sentinel for target in list(SENTINELS) if (sentinel := sentinel_of(target)) is not NULL]
+
+
+# `ty` and every class deriving from it, each once
+def subclasses(ty: type) -> list:
+    found = {id(ty): ty}
+    stack = [ty]
+
+    while stack:
+        for sub in type.__subclasses__(stack.pop()):
+            if id(sub) not in found:
+                found[id(sub)] = sub
+                stack.append(sub)
+
+    return list(found.values())
+
+
+def add_implementor(trait, ty: type):
+    if trait not in IMPLEMENTORS:
+        IMPLEMENTORS[trait] = WeakSet()
+
+    IMPLEMENTORS[trait].add(ty)
+
+
+# Nearest impl of `trait` along the MRO of `ty`
+def find_impl(ty: type, trait):
+    for base in ty.__mro__:
+        if (sentinel := sentinel_of(base)) is not NULL and trait in (traits := sentinel.traits):
+            return traits[trait]
+
+        if base in PENDING and trait in (pending := PENDING[base]):
+            return pending[trait]
 
-def check_bind_wrapper(method, instance, klass):
-    bound = method.__get__(instance, klass)
-    if type(method) == types.MethodType:
+    return NULL
 
-        @wraps(method)
-        def inner(self, *args, **kwargs):
-            return bound(self, *args, **kwargs)
 
-        return inner.__get__(instance, klass)
+# Per-type cache keyed by `id(ty)`, looked up without building a weakref every time.
+# Entries for heap types are dropped when the type is collected, static types live forever
+class TypeCache(dict):
+    __slots__ = ("__weakref__",)
 
-    return bound
+    # compared by identity, so they can be tracked in a WeakSet
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__ # type: ignore
+
+    def __init__(self):
+        TYPE_CACHES.add(self)
+
+    # A miss: the value kept for `ty` outside this dict (see `put`), or `compute(*args)` cached
+    def miss(self, ty: type, compute, *args):
+        if (local := local_caches(ty)) is not None and self in local:
+            return local[self]
+
+        return self.put(ty, compute(*args))
+
+    def put(self, ty: type, value):
+        # a type's own impls usually refer back to it, their methods build instances. Its sentinel lives
+        # in the type, held there such entries can't keep the type alive through a long-lived trait
+        if (local := local_caches(ty)) is not None:
+            local[self] = value
+
+            return value
+
+        self[id(ty)] = value
+
+        # one finalizer per type for every cache, caches are replaced on each impl and must not be kept alive by it
+        if ty.__flags__ & HEAP_TYPE and id(ty) not in FINALIZED_TYPES:
+            FINALIZED_TYPES.add(id(ty))
+            finalize(ty, forget_type, id(ty)).atexit = False
+
+        return value
+
+
+# The {type cache: value} table of a heap type with impls of its own, None for any other type
+def local_caches(ty: type) -> WeakKeyDictionary | None:
+    if ty.__flags__ & HEAP_TYPE and isinstance(sentinel := sentinel_of(ty), ClassAttributeSentinel):
+        return sentinel.type_caches
+
+    return None
+
+
+# every live `TypeCache`, and the ids of the heap types some finalizer will drop from them
+TYPE_CACHES = WeakSet()
+FINALIZED_TYPES = set()
+
+
+def forget_type(key: int):
+    FINALIZED_TYPES.discard(key)
+
+    for cache in list(TYPE_CACHES):
+        cache.pop(key, None)
+
+
+# Exact types a statically bound `self.name(...)` call site may take its fast path for, and the ids
+# of types it may not. Only builtin (never collected) types are accepted, so holding them is fine
+class InlineCache(set):
+    __slots__ = ("rejected",)
+
+    __getattribute__ = object.__getattribute__
+    # compared by identity, so they can be tracked in a WeakSet
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__ # type: ignore
+
+    def __init__(self):
+        self.rejected = set()
+
+
+# Whether `getattr(value_of_ty, name)` resolves to the trait provider `method` bound to the value
+def resolves_to(ty: type, name: str, method) -> bool:
+    if ty.__flags__ & HEAP_TYPE or ty.__dictoffset__:
+        return False
+
+    mro = ty.__mro__
+
+    if any(name in GET_ATTRIBUTE(base, "__dict__") for base in mro):
+        return False
+
+    for base in mro:
+        if (sentinel := sentinel_of(base)) is not NULL and name in sentinel.resolved:
+            return sentinel.resolved[name] is method
+
+    return False
+
+
+# Slow path of a statically bound call site
+def inline_miss(val, name: str, cache: InlineCache, method):
+    ty = type(val)
+
+    if id(ty) not in cache.rejected:
+        if resolves_to(ty, name, method):
+            cache.add(ty)
+
+        else:
+            cache.rejected.add(id(ty))
+
+    return getattr(val, name)
+
+
+# A default method copied onto an impl, statically bound by `inline` the first time it's used rather than
+# when the impl is registered; most defaults never are. Stands in for the function until then, looking it up
+# on a class already hands out the bound function
+class LazyDefault:
+    __slots__ = "trait", "impl", "name", "function", "bound"
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, trait: TraitObject, impl: type, name: str, function):
+        self.trait = trait
+        self.impl = impl
+        self.name = name
+        self.function = function
+        self.bound: types.FunctionType | None = None
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.resolve()
+
+        return self.resolve().__get__(instance, owner)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    @property
+    def __wrapped__(self):
+        return self.function
+
+    def resolve(self):
+        if (bound := self.bound) is None:
+            with REGISTRY_LOCK:
+                if (bound := self.bound) is None:
+                    bound = self.trait._devirtualize_one(self)
+
+        return bound
+
+    def __repr__(self):
+        return f"LazyDefault<{self.function!r}>"
+
+
+# `find_impl` memoized on the trait, misses included
+def cached_impl(ty: type, trait):
+    try:
+        return trait._impl_index[id(ty)]
+
+    except KeyError:
+        return trait._impl_index.miss(ty, find_impl, ty, trait)
+
+
+# Raised on ambiguous names. Ambiguous names are published into class dicts too (see `ClassAttributeSentinel`),
+# as an `AttributeError` they are skipped by `getmembers`, `help` and `hasattr` rather than failing them
+class AmbiguousMethodError(AttributeError, RuntimeError):
+    pass
+
+
+# Stands in for a method name provided by more than one trait
+class AmbiguousMethod:
+    __slots__ = "sentinel", "name"
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, sentinel: MethodSentinel, name: str):
+        self.sentinel = sentinel
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        raise self.error()
+
+    def error(self) -> AmbiguousMethodError:
+        name = self.name
+        sentinel = self.sentinel
+
+        nl = "\n"
+        s = "\n\t"
+
+        impls = (
+            (n, str(trait), sentinel.traits[trait].__name__)
+            for n, trait in enumerate(sentinel.providers[name][::2], start=1)
+        )
+
+        return AmbiguousMethodError(
+            f"Multiple implementations of `{name}` for type `{sentinel.target.__name__}` found.\n\n{nl.join(f'#{n} defined in an implementation of `{trait}`: `{impl}`{s}Hint: disambiguate the associated method: {trait}.{name}{nl}' for n, trait, impl in impls)}"
+        )
+
+    def __repr__(self):
+        return f"AmbiguousMethod<{self.sentinel.target.__name__}.{self.name}>"
+
+
+def make_provider(method):
+    if type(method) is not types.MethodType and hasattr(type(method), "__get__"):
+        return method
+
+    return TraitMethod(method)
 
 
 class MethodSentinel:
+    # one per hooked type, so keep them small
+    __slots__ = (
+        "target", "native", "shadowable", "traits", "providers", "resolved", "cache",
+        "hooks", "slot", "finalizer", "lookup", "table", "__weakref__",
+    )
+
+    # sentinels must never dispatch through a hooked `object`
+    __getattribute__ = object.__getattribute__
+
     def __init__(self, target: type):
         self.target = target
+        self.native = native_getattribute(target)
+        self.shadowable = target.__dictoffset__ != 0
 
         self.traits = {}
+        # name -> method, or an `AmbiguousMethod` when more than one trait provides it
+        self.resolved = {}
+        # only ambiguous names are listed here, as (trait, method, trait, method, ...)
         self.providers = {}
-        self.methods = set()
+        self.cache = {}
+
+        # ((name, original dict entry or NULL), ...) and the attribute slot from before the hooks went in
+        self.hooks: tuple = ()
+        self.slot: int | None = None
+        self.finalizer: finalize | None = None
 
+    # Callers hold REGISTRY_LOCK, readers only ever see complete tables
     def add_impl(self, trait: TraitObject, impl):
         assert trait.inner not in self.traits, f"existing implementation for {trait} found: {impl}"
 
+        providers = dict(self.providers)
+        resolved = dict(self.resolved)
+
+        METHOD_NAMES.update(trait.trait_methods)
+
         for name in trait.trait_methods:
-            method = getattr(impl, name)
+            method = make_provider(getattr(impl, name))
 
-            if name in self.providers:
-                self.providers[name][trait.inner] = method
+            if name in providers:
+                providers[name] = (*providers[name], trait.inner, method)
+
+            elif name in resolved:
+                providers[name] = (self.provider_of(name), resolved[name], trait.inner, method)
+                resolved[name] = AmbiguousMethod(self, name)
 
             else:
-                self.providers[name] = {trait.inner: method}
+                resolved[name] = method
+
+        self.providers = providers
+        self.traits = {**self.traits, trait.inner: impl}
+        self.resolved = resolved
+
+        add_implementor(trait.inner, self.target)
 
-        self.traits[trait.inner] = impl
-        self.methods = set(self.providers.keys())
+        self.invalidate()
+        trait.inner._invalidate()
 
+    # Callers hold REGISTRY_LOCK
     def remove_impl(self, trait: TraitObject):
-        return NotImplemented
+        providers = dict(self.providers)
+        resolved = dict(self.resolved)
+
+        for name in trait.trait_methods:
+            if name not in providers:
+                del resolved[name]
+                continue
+
+            pairs = providers.pop(name)
+            i = pairs[::2].index(trait.inner) * 2
+            remaining = pairs[:i] + pairs[i + 2:]
+
+            if len(remaining) == 2:
+                resolved[name] = remaining[1]
+
+            else:
+                providers[name] = remaining
+
+        self.providers = providers
+        self.traits = {other: impl for other, impl in self.traits.items() if other is not trait.inner}
+        self.resolved = resolved
+
+        IMPLEMENTORS[trait.inner].discard(self.target)
+
+        self.invalidate()
+        trait.inner._invalidate()
+
+    # subclasses inherit our methods, so their resolutions go stale with ours
+    def invalidate(self):
+        # every hooked type subclasses `object`, the registry is the shorter walk there
+        if self.target is object:
+            types = [sentinel.target for sentinel in installed_sentinels()]
+
+        else:
+            types = subclasses(self.target)
+
+        for ty in types:
+            # class attribute sentinels have no cache to go stale
+            if (sentinel := sentinel_of(ty)) is not NULL and not isinstance(sentinel, ClassAttributeSentinel):
+                sentinel.cache = {}
+
+        for cache in list(INLINE_CACHES):
+            cache.clear()
+            cache.rejected.clear()
 
     def has_impl(self, trait: Trait) -> bool:
         return trait in self.traits
 
+    # Callers hold REGISTRY_LOCK. Swap one provider of `name` for an equivalent one
+    def replace_provider(self, name: str, old, new):
+        if self.resolved.get(name) is old:
+            self.resolved = {**self.resolved, name: new}
+
+        elif name in self.providers:
+            self.providers = {**self.providers, name: tuple(new if method is old else method for method in self.providers[name])}
+
+        else:
+            return
+
+        self.invalidate()
+
+    # The single trait providing `name`
+    def provider_of(self, name):
+        return next(trait for trait in self.traits if name in trait._trait_methods)
+
+    # Nearest provider along the MRO, impls on base classes are inherited
+    def find_method(self, name):
+        for base in self.target.__mro__:
+            if (sentinel := sentinel_of(base)) is not NULL and name in (resolved := sentinel.resolved):
+                return resolved[name]
+
+        return NULL
+
     def get_unbound(self, name):
-        if name in self.methods:
-            if len(self.traits) == 1 or len(self.providers[name]) == 1:
-                return tuple(self.providers[name].values())[0]
+        if (method := self.find_method(name)) is not NULL:
+            if type(method) is AmbiguousMethod:
+                raise method.error()
 
-            nl = "\n"
-            s = "\n\t"
+            return method
 
-            impls = (
-                (n, str(trait), self.traits[trait].__name__)
-                for n, trait in enumerate(self.providers[name].keys(), start=1)
-            )
+    # Decide once per name whether lookups are native or trait-provided
+    def resolve(self, name):
+        # an invalidation while resolving swaps in a new cache, the stale result lands in the old one
+        cache = self.cache
+        method = self.find_method(name)
 
-            raise RuntimeError(
-                f"Multiple implementations of `{name}` for type `{self.target.__name__}` found.\n\n{nl.join(f'#{n} defined in an implementation of `{trait}`: `{impl}`{s}Hint: disambiguate the associated method: {trait}.{name}{nl}' for n, trait, impl in impls)}"
-            )
+        if method is NULL or any(
+            name in GET_ATTRIBUTE(base, "__dict__") and not published_by(base, name) for base in self.target.__mro__
+        ):
+            method = NATIVE
+
+        cache[name] = method
+
+        return method
 
     def __call__(self, val, key):
-        #assert type(val) is self.target, f"Mismatched types: {type(val)} - {self.target} ({val} [{key}])"
+        # no attribute access on builtins in here; they may be hooked too
+        if key not in METHOD_NAMES:
+            method = NATIVE
 
-        if (method := OBJ_HAS_ATTRIBUTE(val, key)) is not NULL:
-            return method
+        else:
+            try:
+                method = self.cache[key]
 
-        if method := self.get_unbound(key):
-            return check_bind_wrapper(method, val, self.target)
+            except KeyError:
+                method = self.resolve(key)
 
-        raise AttributeError(key)
+        if method is NATIVE:
+            return self.native(val, key)
+
+        return self.dispatch(val, key, method)
+
+    def dispatch(self, val, key, method):
+        # instance attributes (or a subclass) may still shadow the trait method
+        if self.shadowable or type(val) is not self.target or type(method) is AmbiguousMethod:
+            if (attr := HAS_NATIVE(self.native, val, key)) is not NULL:
+                return attr
+
+        if TRACER is not None:
+            return TRACER.bind(self, val, key, method)
+
+        return method.__get__(val, self.target)
+
+    # `__getattr__` entry point, the native lookup has already failed by now
+    def fallback(self, val, key):
+        if key not in METHOD_NAMES:
+            method = NATIVE
+
+        else:
+            try:
+                method = self.cache[key]
+
+            except KeyError:
+                method = self.resolve(key)
+
+        if method is NATIVE:
+            raise missing(val, key)
+
+        if TRACER is not None:
+            return TRACER.bind(self, val, key, method)
+
+        return method.__get__(val, self.target)
+
+    # Resolve every trait method up front into a flat, read-only table
+    def freeze(self: MethodSentinel):
+        self.cache = {}
+
+        names = set()
+
+        for base in self.target.__mro__:
+            if (sentinel := sentinel_of(base)) is not NULL:
+                names |= sentinel.resolved.keys()
+
+        table = {name: self.resolve(name) for name in names}
+
+        # bound to the dict itself, a mappingproxy would look `get` up on every call
+        self.lookup = table.get
+        self.table = MappingProxyType(table)
+
+        self.__class__ = FrozenMethodSentinel
 
     def __repr__(self):
         return f"MethodSentinel<{self.target.__name__}>"
 
 
+class FrozenMethodSentinel(MethodSentinel):
+    __slots__ = ()
+
+    def __call__(self, val, key):
+        if (method := self.lookup(key, NATIVE)) is NATIVE:
+            return self.native(val, key)
+
+        return self.dispatch(val, key, method)
+
+    def fallback(self, val, key):
+        if (method := self.lookup(key, NATIVE)) is NATIVE:
+            raise missing(val, key)
+
+        if TRACER is not None:
+            return TRACER.bind(self, val, key, method)
+
+        return method.__get__(val, self.target)
+
+    def thaw(self: MethodSentinel):
+        self.__class__ = MethodSentinel
+
+        del self.lookup, self.table
+
+    def __repr__(self):
+        return f"FrozenMethodSentinel<{self.target.__name__}>"
+
+
+# Stands in for a trait method in a class dict, handing its lookups to the nearest sentinel providing it.
+# Published on `object`, where hooked types below still have to get their own method, and on every class
+# while `traitor.stats` or a `trace()` block has to see the lookups
+class SentinelMethod:
+    __slots__ = ("name",)
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner: type | None = None):
+        ty = type(instance) if instance is not None or owner is None else owner
+
+        for base in ty.__mro__:
+            if (sentinel := sentinel_of(base)) is not NULL and self.name in sentinel.resolved:
+                if instance is None:
+                    return sentinel.get_unbound(self.name).__get__(None, ty)
+
+                return sentinel.fallback(instance, self.name)
+
+        raise AttributeError(self.name)
+
+    def __repr__(self):
+        return f"SentinelMethod<{self.name}>"
+
+
+# Bookkeeping for a class we can just set attributes on. Its resolved methods are published into the
+# class dict, so lookups never leave the interpreter's own attribute machinery and nothing is hooked.
+# `object` is served the same way, a hook on it would be copied into every class there is
+class ClassAttributeSentinel(MethodSentinel):
+    __slots__ = ("published", "type_caches")
+
+    # whether every lookup has to reach `fallback`, `traitor.stats` counts them there
+    counted = False
+
+    def __init__(self, target: type):
+        MethodSentinel.__init__(self, target)
+
+        # name -> the value we put in the class dict
+        self.published = {}
+        # what trait caches hold for the target, see `TypeCache.put`
+        self.type_caches = WeakKeyDictionary()
+
+    def add_impl(self, trait: TraitObject, impl):
+        MethodSentinel.add_impl(self, trait, impl)
+        self.publish()
+
+    def remove_impl(self, trait: TraitObject):
+        MethodSentinel.remove_impl(self, trait)
+        self.publish()
+
+    def replace_provider(self, name: str, old, new):
+        MethodSentinel.replace_provider(self, name, old, new)
+        self.publish()
+
+    # Sync the class dict with the resolved table. Attributes the class (or a base) defines itself
+    # still win over trait methods, as they do on hooked types
+    def publish(self):
+        target = self.target
+        attrs = GET_ATTRIBUTE(target, "__dict__")
+        published = {}
+
+        for name, method in self.resolved.items():
+            if name in attrs and (name not in self.published or attrs[name] is not self.published[name]):
+                continue
+
+            if any(defines(base, name) for base in target.__mro__[1:]):
+                continue
+
+            if target is object or ((self.counted or TRACER is not None) and type(method) is not AmbiguousMethod):
+                method = SentinelMethod(name)
+
+            set_class_attribute(target, name, method)
+            published[name] = method
+
+        for name, method in self.published.items():
+            if name not in published and name in attrs and attrs[name] is method:
+                delete_class_attribute(target, name)
+
+        self.published = published
+
+    # Reached through a published `SentinelMethod`, never through a hook
+    def fallback(self, val, key):
+        method = self.resolved[key]
+
+        if TRACER is not None:
+            return TRACER.bind(self, val, key, method)
+
+        return method.__get__(val, self.target)
+
+    # nothing dispatches through us, there is nothing to compile
+    def freeze(self):
+        pass
+
+    def thaw(self):
+        pass
+
+    def __repr__(self):
+        return f"ClassAttributeSentinel<{self.target.__name__}>"
+
+
+# The error for a failed lookup of `key` on `val`. An ambiguous name published on the class of `val`
+# raises an `AttributeError` that lands in a base's fallback hook, report it rather than a plain miss
+def missing(val, key: str) -> AttributeError:
+    if key in METHOD_NAMES:
+        for base in type(val).__mro__:
+            if key in (attrs := GET_ATTRIBUTE(base, "__dict__")):
+                if type(method := attrs[key]) is AmbiguousMethod:
+                    return method.error()
+
+                break
+
+    return AttributeError(key)
+
+
+# Whether `ty.name` is a trait method we put there
+def published_by(ty: type, name: str) -> bool:
+    sentinel = sentinel_of(ty)
+
+    return isinstance(sentinel, ClassAttributeSentinel) and name in sentinel.published
+
+
+# Whether `ty` defines `name` itself, rather than traitor having put a trait method (or a stand-in for one) there
+def defines(ty: type, name: str) -> bool:
+    attrs = GET_ATTRIBUTE(ty, "__dict__")
+
+    return name in attrs and type(attrs[name]) is not PendingMethod and not published_by(ty, name)
+
+
+def published_names(ty: type) -> set[str]:
+    """
+    Attributes of `ty` that are trait methods traitor placed on it or its bases, rather than its own.
+    """
+
+    return {
+        name
+        for base in ty.__mro__
+        if isinstance(sentinel := sentinel_of(base), ClassAttributeSentinel)
+        for name in sentinel.published
+    }
+
+
+# Publish every class attribute sentinel again, once what their lookups have to go through changed
+def republish():
+    for sentinel in installed_sentinels():
+        if isinstance(sentinel, ClassAttributeSentinel):
+            sentinel.publish()
+
+
+# classes new sentinels are made from, `traitor.stats` swaps in instrumented ones while enabled
+SENTINEL_TYPE = MethodSentinel
+CLASS_SENTINEL_TYPE = ClassAttributeSentinel
+# recorder of the active `trace()` block, only consulted once a lookup resolved to a trait method
+TRACER = None
+
+
 # Root sentinel
 @type.__call__
 class TypeLevelSentinel:
@@ -122,27 +924,76 @@ class TypeLevelSentinel:
 
         if (sentinel := HAS_ATTRIBUTE(ty, "__sentinel")) is not NULL:
             if method := sentinel.get_unbound(key):
-                return method
+                return method.__get__(None, ty)
+
+        raise AttributeError(key)
+
+    # `__getattr__` entry point, only reached for attributes the type doesn't have
+    def fallback(self, ty, key):
+        if (sentinel := HAS_ATTRIBUTE(ty, "__sentinel")) is not NULL:
+            if method := sentinel.get_unbound(key):
+                return method.__get__(None, ty)
 
         raise AttributeError(key)
 
+
+# A zero-argument callable returning `value`, a weak reference to it wherever one can be taken
+def weak(value):
+    try:
+        return ref(value)
+
+    except TypeError:
+        return lambda: value
+
+
+# The parameterized trait `origin[*args]` built earlier, or None
+def cached_generic(origin: TraitMeta, args: tuple):
+    if len(args) == 1:
+        try:
+            return GENERIC_CACHE[origin][args[0]]
+
+        except (KeyError, TypeError):
+            pass
+
+    try:
+        return GENERIC_VALUES.get((origin, args))
+
+    # unhashable arguments
+    except TypeError:
+        return None
+
+
 class TraitMeta(type):
     def __getitem__(cls, *args):
-        if (cls, args) in GENERIC_CACHE:
-            return GENERIC_CACHE[(cls, args)]
+        if (new := cached_generic(cls, args)) is not None:
+            return new
 
         if hasattr(cls, "__generic__"):
-            new = TraitMeta(cls.__name__, (Trait,), {**cls.__dict__})
-            new.__args__ = new.__generic__(new, *args)
-            
-            # for k, v in new.__dict__.items():
-            #     if type(v) == classmethod:
-            #         setattr(new, k, v.__func__.__get__(new, TraitMeta))
+            with REGISTRY_LOCK:
+                # another thread may have built it while we waited
+                if (new := cached_generic(cls, args)) is not None:
+                    return new
 
-            GENERIC_CACHE[(cls, args)] = new
+                # the arguments are only held weakly, the cache and every impl of `new` would pin them otherwise
+                subscript = tuple(map(weak, args))
+
+                # `__origin__` lets `__init_subclass__` reuse our method metadata
+                new = TraitMeta(cls.__name__, (Trait,), {**cls.__dict__, "__origin__": cls, "__subscript__": subscript})
+                new.__args__ = tuple(map(weak, new.__generic__(new, *args)))
+
+                # for k, v in new.__dict__.items():
+                #     if type(v) == classmethod:
+                #         setattr(new, k, v.__func__.__get__(new, TraitMeta))
+
+                if len(args) == 1 and type(subscript[0]) is ref:
+                    GENERIC_CACHE.setdefault(cls, WeakKeyDictionary())[args[0]] = new
+
+                else:
+                    GENERIC_VALUES[(cls, args)] = new
+                    GENERIC_KEEPALIVE.append(new)
 
             return new
-        
+
         raise TypeError(f"Trait {cls} defines no generic parameters")
 
     def __rshift__(cls, other):
@@ -158,53 +1009,149 @@ class TraitMeta(type):
         if not hasattr(cls, "__args__"):
             return cls.__name__
 
-        return f"{cls.name}[{', '.join(ty.__name__ for ty in cls.__args__)}]"
+        return f"{cls.name}[{', '.join(getattr(ty(), '__name__', '<collected>') for ty in cls.__args__)}]"
 
     def __call__(cls, key):
-        if type(key) is type:
-            if hasattr(key, "__sentinel"):
-                if getattr(key, "__sentinel").has_impl(cls):
-                    return getattr(key, "__sentinel").traits[cls]
+        if isinstance(key, type):
+            if TRACER is not None:
+                impl = TRACER.lookup(cls, key)
 
             else:
-                raise TypeError(f"{cls} is not implemented for {key.__name__}")
+                impl = cached_impl(key, cls)
+
+            if impl is not NULL:
+                return impl
+
+            raise TypeError(f"{cls} is not implemented for {key.__name__}")
 
         else:
             raise TypeError("type specification allowed only with types")
 
+    def static(cls, name: str) -> StaticDispatch:
+        """
+        Call a trait method without going through attribute hooks: `Trait.static("method")(value, *args)`.
+        Implementations are resolved once per concrete type.
+        """
+
+        try:
+            return cls._dispatchers[name]
+
+        except KeyError:
+            if name not in TraitObject(cls).trait_methods:
+                raise AttributeError(f"{cls} has no method {name!r}") from None
+
+            with REGISTRY_LOCK:
+                if name not in cls._dispatchers:
+                    cls._dispatchers = {**cls._dispatchers, name: StaticDispatch(cls, name)}
+
+                return cls._dispatchers[name]
+
+    # Drop every cached type -> impl resolution for this trait
+    def _invalidate(cls):
+        cls._impl_index = TypeCache()
+        cls._vtables = TypeCache()
+
+        for dispatch in cls._dispatchers.values():
+            dispatch.cache = TypeCache()
+
 class Trait(object, metaclass=TraitMeta):
     name: str
     _required_methods: tuple
     _fallback_methods: tuple
     _trait_methods: tuple
     _has_derive: bool
+    _impl_index: TypeCache
+    _dispatchers: dict
+    _vtables: TypeCache
+    _dyn_class: type | None
 
     def __init_subclass__(cls):
+        cls._impl_index = TypeCache()
+        cls._dispatchers = {}
+        cls._vtables = TypeCache()
+        cls._dyn_class = None
+
+        # parameterized traits have the same methods as their origin
+        if "__origin__" in cls.__dict__:
+            origin = cls.__dict__["__origin__"]
+
+            cls._required_methods = origin._required_methods
+            cls._fallback_methods = origin._fallback_methods
+            cls._trait_methods = origin._trait_methods
+            cls._has_derive = origin._has_derive
+            cls.name = origin.name
+
+            return
+
         def check(m):
             if hasattr(m, "__code__"):
                 code = m.__code__
 
-            elif hasattr(m, "__func__"):
-                code = m.__func__.__code__
+            elif hasattr(m, "__func__"):
+                code = m.__func__.__code__
+
+            else:
+                raise RuntimeError(f"Unknown `{m}`: {dir(m)}")
+
+            return has_empty_body(code)
+
+        def get_methods():
+            # trait methods published on `object` show up on every class, they aren't ours
+            published = published_names(cls)
+            members = tuple(
+                (name, check(m))
+                for name, m in getmembers(cls, isroutine)
+                if not name.startswith("__") and name not in published
+            )
+
+            return (
+                tuple(name for name, empty in members if empty),
+                tuple(name for name, empty in members if not empty),
+            )
+
+        required, fallback = snapshot.lookup("trait_methods", cls, get_methods)
+
+        # interned like the attribute names they get looked up by, so cache hits compare by identity
+        cls._required_methods = tuple(map(sys.intern, required))
+        cls._fallback_methods = tuple(map(sys.intern, fallback))
+
+        cls._trait_methods = cls._required_methods + cls._fallback_methods
+        cls.name = cls.__name__
+        cls._has_derive = hasattr(cls, "__derive__")
+
+
+# UFCS-style entry point for a single trait method, see `TraitMeta.static`
+class StaticDispatch:
+    __slots__ = "trait", "name", "cache"
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, trait: TraitMeta, name: str):
+        self.trait = trait
+        self.name = name
+        self.cache = TypeCache()
+
+    # The implementation of this method for a concrete type, callable as `method(value, *args)`
+    def of(self, ty: type):
+        cache = self.cache
 
-            else:
-                raise RuntimeError(f"Unknown `{m}`: {dir(m)}")
+        try:
+            return cache[id(ty)]
 
-            return code.co_code
+        except KeyError:
+            return cache.miss(ty, lambda: getattr(self.trait(ty), self.name))
 
-        def get_methods(stat):
-            return tuple(
-                name
-                for name, m in getmembers(cls, isroutine)
-                if not name.startswith("__") and stat(check(m), NO_BODY_FUNCTION_CODE)
-            )
+    def __call__(self, value, *args, **kwargs):
+        try:
+            method = self.cache[id(type(value))]
 
-        cls._required_methods = get_methods(operator.eq)
-        cls._fallback_methods = get_methods(operator.ne)
+        except KeyError:
+            method = self.of(type(value))
 
-        cls._trait_methods = cls._required_methods + cls._fallback_methods
-        cls.name = cls.__name__
-        cls._has_derive = hasattr(cls, "__derive__")
+        return method(value, *args, **kwargs)
+
+    def __repr__(self):
+        return f"StaticDispatch<{self.trait}.{self.name}>"
 
 
 # Resolves method discrepancies between a declaration and an implementation
@@ -227,9 +1174,25 @@ class TraitObject:
 
         raise KeyError(name)
 
-    # Copy default impls over to the provided impl
-    def _coalesce_methods(self, impl: type):
-        impl_methods = tuple(name for name, _ in getmembers(impl, isroutine) if not name.startswith("__"))
+    # Names of every routine on `impl`, served from the snapshot when one is loaded. Read from the class dicts,
+    # `getmembers` would bind any `LazyDefault` an earlier impl left there
+    @staticmethod
+    def _impl_routines(impl: type) -> tuple:
+        def compute():
+            members = {}
+
+            for base in reversed(impl.__mro__):
+                for name, value in GET_ATTRIBUTE(base, "__dict__").items():
+                    if not published_by(base, name):
+                        members[name] = type(value) is LazyDefault or isroutine(value)
+
+            return tuple(sorted(name for name, routine in members.items() if routine))
+
+        return snapshot.lookup("routines", impl, compute)
+
+    # Copy default impls over to the provided impl, see `inline` for `devirtualize`
+    def _coalesce_methods(self, impl: type, devirtualize: bool = False):
+        impl_methods = tuple(name for name in self._impl_routines(impl) if not name.startswith("__"))
 
         optional = set(self.fallback_methods)
         have = set(impl_methods)
@@ -240,9 +1203,54 @@ class TraitObject:
         for name in optional - have:
             setattr(impl, name, self._get_method(name))
 
+        if devirtualize:
+            self._devirtualize(impl, optional - have)
+
+    # Statically bind the trait method calls the copied defaults make on `self`, once each is first used
+    def _devirtualize(self, impl: type, names):
+        for name in names:
+            if type(method := getattr(impl, name)) is types.FunctionType:
+                setattr(impl, name, LazyDefault(self, impl, name, method))
+
+    # Callers hold REGISTRY_LOCK. Rewrite `lazy` and put the result wherever `lazy` was published
+    def _devirtualize_one(self, lazy: LazyDefault):
+        impl = lazy.impl
+        new = lazy.bound = inline.rewrite(lazy.function, self.trait_methods) or lazy.function
+
+        # the defaults this one calls are bound to their rewritten versions, `bound` is set first to end cycles
+        def value(free):
+            if free == "__type":
+                return type
+
+            if free == "__miss":
+                return inline_miss
+
+            if free.startswith("__ok_"):
+                INLINE_CACHES.add(cache := InlineCache())
+
+                return cache
+
+            method = getattr(impl, free[len("__impl_"):])
+
+            return method.resolve() if type(method) is LazyDefault else method
+
+        if new is not lazy.function:
+            inline.bind(new, value)
+
+        if GET_ATTRIBUTE(impl, "__dict__").get(lazy.name) is lazy:
+            setattr(impl, lazy.name, new)
+
+        for ty in implementors(self.inner):
+            if (sentinel := sentinel_of(ty)) is not NULL and sentinel.traits.get(self.inner) is impl:
+                sentinel.replace_provider(lazy.name, lazy, new)
+
+        self.inner._invalidate()
+
+        return new
+
     # Ensure our implementation matches our definition
     def _check_coverage(self, impl: type):
-        impl_methods = tuple(name for name, _ in getmembers(impl, isroutine) if not name.startswith("_"))
+        impl_methods = tuple(name for name in self._impl_routines(impl) if not name.startswith("_"))
 
         optional = set(self.fallback_methods)
         have = set(impl_methods) - optional
@@ -280,6 +1288,34 @@ class TraitObject:
         return str(self.inner)
 
 
+# Trait object handle, see `dyn`
+class Dyn:
+    # mangled, so a trait method can't be named like them
+    __slots__ = "__value", "__vtable"
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, value, vtable: dict):
+        self.__value = value
+        self.__vtable = vtable
+
+    # Only reached the first time a method slot is read, after that it's a plain slot load
+    def __getattr__(self, name):
+        try:
+            method = self.__vtable[name]
+
+        except KeyError:
+            raise AttributeError(name) from None
+
+        bound = method.__get__(self.__value, type(self.__value))
+        object.__setattr__(self, name, bound)
+
+        return bound
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.__value!r})"
+
+
 # Simple container
 class ImplTarget:
     __slots__ = "trait", "target"
@@ -295,32 +1331,448 @@ class ImplTarget:
 class TraitImpl:
     __slots__ = "trait", "target", "impl"
 
-    def __init__(self, target: ImplTarget, impl):
+    def __init__(self, target: ImplTarget, impl, checked: bool = False):
         self.trait = target.trait
         self.target = target.target
         self.impl = impl
 
-        self.trait._check_coverage(impl)
+        if not checked:
+            self.trait._check_coverage(impl)
+
+    # `with impl(Trait >> ty)(Impl): ...` keeps the impl around for the block only
+    def __enter__(self):
+        if not has_own_impl(self.target, self.trait.inner):
+            self.apply()
+
+        return self
+
+    def __exit__(self, *exc):
+        self.remove()
+
+    def remove(self):
+        remove_impl(self.trait.inner, self.target)
 
     def apply(self):
-        self.trait._coalesce_methods(self.impl)
+        with REGISTRY_LOCK:
+            if FROZEN:
+                raise RuntimeError(f"cannot apply {self.impl.__name__}, the trait registry is frozen (see traitor.thaw)")
+
+            # classes taking plain attributes already look methods up natively
+            self.trait._coalesce_methods(self.impl, devirtualize=not takes_class_attributes(self.target))
+            self.install()
+
+    # Hook the target up to the already coalesced impl, callers hold REGISTRY_LOCK
+    def install(self):
+        snapshot.record_impl(self.trait.inner, self.target, self.impl)
 
         if "__sentinel" not in self.target.__dict__.keys():
-            sentinel = MethodSentinel(self.target)
+            if takes_class_attributes(self.target):
+                install_class_sentinel(self.target)
 
-            @wraps(self.target.__getattribute__)
-            def wrapper(o, k):
-                return sentinel(o, k)
+            elif DEFER_HOOKS:
+                return self.defer()
 
-            hook(self.target, "__sentinel")(sentinel)
-            hook(self.target, "__getattribute__")(wrapper)
+            else:
+                install_sentinel(self.target)
 
         GET_ATTRIBUTE(self.target, "__sentinel").add_impl(self.trait, self.impl)
 
+    # Record the impl without touching the target, see `set_deferred_hooks`
+    def defer(self):
+        pending = PENDING[self.target] if self.target in PENDING else {}
+        assert self.trait.inner not in pending, f"existing implementation for {self.trait} found: {self.impl}"
+
+        PENDING[self.target] = {**pending, self.trait.inner: self.impl}
+        add_implementor(self.trait.inner, self.target)
+        publish_pending(self.target)
+
+        self.trait.inner._invalidate()
+
+        if TYPE_HOOK_AUTO:
+            install_type_hook()
+
+
+# Install the deferred impls of `ty` and its bases, returns whether there were any.
+# With `key`, only if one of them provides that method
+def install_pending(ty: type, key: str | None = None) -> bool:
+    with REGISTRY_LOCK:
+        deferred = {base: PENDING[base] for base in ty.__mro__ if base in PENDING}
+
+        if key is not None and not any(key in trait._trait_methods for pending in deferred.values() for trait in pending):
+            return False
+
+        if not deferred:
+            return False
+
+        for target in deferred:
+            del PENDING[target]
+            publish_pending(target)
+
+        for target, pending in deferred.items():
+            if (sentinel := sentinel_of(target)) is NULL:
+                sentinel = install_sentinel(target)
+
+            for trait, impl in pending.items():
+                sentinel.add_impl(TraitObject(trait), impl)
+
+        return True
+
+
+# Stands in for a method the deferred impls of a type provide, in that type's own dict. The first lookup
+# installs them and takes the stand-ins out again; attribute access on the type is left alone until then
+class PendingMethod:
+    __slots__ = ("name",)
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner: type | None = None):
+        ty = type(instance) if instance is not None or owner is None else owner
+
+        install_pending(ty, self.name)
+
+        return getattr(ty if instance is None else instance, self.name)
+
+    def __repr__(self):
+        return f"PendingMethod<{self.name}>"
+
+
+# Callers hold REGISTRY_LOCK. Sync the stand-ins in the dict of `ty` with its deferred impls. Names that
+# `ty` or a base defines itself win over the trait methods once installed, they don't get one
+def publish_pending(ty: type):
+    attrs = GET_ATTRIBUTE(ty, "__dict__")
+    names = {name for trait in (PENDING[ty] if ty in PENDING else ()) for name in trait._trait_methods}
+
+    for name in names:
+        if type(attrs.get(name)) is not PendingMethod and not any(defines(base, name) for base in ty.__mro__):
+            set_class_attribute(ty, name, PendingMethod(name))
+
+    for name in [name for name, value in attrs.items() if type(value) is PendingMethod and name not in names]:
+        delete_class_attribute(ty, name)
+
+
+# Callers hold REGISTRY_LOCK
+# Classes defined in Python get their trait methods as plain class attributes instead of hooks, and so
+# does `object` (see `ClassAttributeSentinel`)
+def takes_class_attributes(ty: type) -> bool:
+    return ty is object or (bool(ty.__flags__ & HEAP_TYPE) and not ty.__flags__ & IMMUTABLE_TYPE)
+
+
+def install_class_sentinel(target: type) -> ClassAttributeSentinel:
+    sentinel = CLASS_SENTINEL_TYPE(target)
+    SENTINELS.add(target)
+
+    set_class_attribute(target, "__sentinel", sentinel)
+    sentinel.hooks = (("__sentinel", NULL),)
+
+    if TYPE_HOOK_AUTO:
+        install_type_hook()
+
+    return sentinel
+
+
+# Name the hook after its type, profilers would show every one of them as the same anonymous `wrapper`
+def hook_code(fn, target: type):
+    return fn.__code__.replace(co_name=f"<traitor {fn.__name__} of {target.__qualname__}>")
+
+
+# The attribute slot of `target` from before any hooks; one it inherited from a hooked base is that base's original
+def original_slot(target: type):
+    if type(native := GET_ATTRIBUTE(target, "__dict__").get("__getattribute__")) is types.WrapperDescriptorType:
+        return wrapped_slot(native)
+
+    slot = get_slot(target, "__getattribute__").value
+
+    for base in target.__mro__[1:]:
+        if base in SENTINELS and (original := sentinel_of(base).slot) is not None:
+            break
+
+    else:
+        return slot
+
+    return original if slot == get_slot(base, "__getattribute__").value or slot in PYTHON_GETATTR_SLOTS else slot
+
+
+def install_sentinel(target: type) -> MethodSentinel:
+    sentinel = SENTINEL_TYPE(target)
+    SENTINELS.add(target)
+
+    # a user-defined `__getattr__` would be clobbered by the fallback hook
+    getattr_hook = mro_lookup(target, "__getattr__")
+    attrs = GET_ATTRIBUTE(target, "__dict__")
+
+    def original(name):
+        return attrs[name] if name in attrs else NULL
+
+    sentinel.slot = original_slot(target)
+
+    if HOOK_MODE == "fallback" and (getattr_hook is NULL or getattr_hook in SENTINEL_WRAPPERS):
+
+        def __getattr__(o, k=NULL):
+            if k is NULL:
+                o, k = None, o
+
+            return sentinel.fallback(o, k)
+
+        __getattr__.__code__ = hook_code(__getattr__, target)
+
+        SENTINEL_WRAPPERS[__getattr__] = ref(sentinel)
+        sentinel.hooks = (("__sentinel", NULL), ("__getattr__", original("__getattr__")))
+
+        hook_fallback(target, {"__sentinel": sentinel, "__getattr__": __getattr__})
+
+    else:
+
+        def __getattribute__(o, k=NULL):
+            if k is NULL:
+                o, k = None, o
+
+            return sentinel(o, k)
+
+        # swapped before `wraps`, pyright doesn't know what it hands back has a `__code__`
+        __getattribute__.__code__ = hook_code(__getattribute__, target)
+        wrapper = wraps(target.__getattribute__)(__getattribute__)
+
+        SENTINEL_WRAPPERS[wrapper] = ref(sentinel)
+        sentinel.hooks = (("__sentinel", NULL), ("__getattribute__", original("__getattribute__")))
+
+        hook(target, "__sentinel")(sentinel)
+        hook(target, "__getattribute__")(wrapper)
+
+    # fishhook remembers what it replaced so hooks can call through, which would pin the type
+    # (or its base's sentinel) forever; we keep our own originals
+    for name, _ in sentinel.hooks:
+        fishhook.methods_cache.pop(f"{id(target)}.{name}", None)
+
+    # drop fishhook's bookkeeping along with the type, its id may be reused. The callback can fire
+    # during interpreter teardown, so it must not run any Python code of ours
+    if target.__flags__ & HEAP_TYPE:
+        sentinel.finalizer = finalize(target, fishhook.hooks.difference_update, [f"{id(target)}.{name}" for name, _ in sentinel.hooks])
+        sentinel.finalizer.atexit = False
+
+    if TYPE_HOOK_AUTO:
+        install_type_hook()
+
+    return sentinel
+
+
+# Weakrefs to builtin types get cleared while the interpreter tears them down, and the callbacks
+# that fire then run through our hooks on half-finalized types. Builtins never die anyway, so just
+# let go of every weak container before that happens
+@atexit.register
+def release_registry():
+    SENTINELS.clear()
+    IMPLEMENTORS.clear()
+    PENDING.clear()
+    SENTINEL_WRAPPERS.clear()
+
+    todo = type.__subclasses__(Trait)
+
+    while todo:
+        trait = todo.pop()
+        trait._invalidate()
+        todo.extend(type.__subclasses__(trait))
+
+
+# Undo `install_sentinel` once a type has no impls left
+def uninstall_sentinel(target: type):
+    sentinel = sentinel_of(target)
+    SENTINELS.discard(target)
+
+    if sentinel.finalizer is not None:
+        sentinel.finalizer.detach()
+
+    for wrapper in [wrapper for wrapper, other in SENTINEL_WRAPPERS.items() if other() is sentinel]:
+        del SENTINEL_WRAPPERS[wrapper]
+
+    for name, original in sentinel.hooks:
+        remove_hook(target, name, original=original)
+
+    # class attribute sentinels never touched the slot
+    if (slot := sentinel.slot) is not None:
+        # a base hooked after us still has to see our lookups, so take its slot instead
+        for base in target.__mro__[1:]:
+            if base in SENTINELS:
+                slot = get_slot(base, "__getattribute__").value or slot
+
+                break
+
+        restore_getattr_slot(target, slot)
+
+    # nothing left to find on the types themselves
+    if not SENTINELS and not PENDING:
+        uninstall_type_hook()
+
+
+def install_type_hook():
+    global TYPE_HOOK
+
+    with REGISTRY_LOCK:
+        if TYPE_HOOK is not None:
+            return
+
+        slot = original_slot(type)
+
+        if HOOK_MODE == "fallback":
+            hook_fallback(type, {"__getattr__": type_fallback})
+            TYPE_HOOK = ("__getattr__", slot)
+
+        else:
+            hook(type, "__getattribute__")(type_wrapper)
+            TYPE_HOOK = ("__getattribute__", slot)
+
+
+def uninstall_type_hook():
+    global TYPE_HOOK
+
+    with REGISTRY_LOCK:
+        if TYPE_HOOK is None:
+            return
+
+        name, slot = TYPE_HOOK
+        remove_hook(type, name, original=GET_ATTRIBUTE if name == "__getattribute__" else NULL)
+        restore_getattr_slot(type, slot)
+
+        TYPE_HOOK = None
+
 
 # user facing functions
 
 
+def set_hook_mode(mode: str):
+    """
+    Choose how new sentinels are installed on their target types.
+
+    "fallback" (the default) leaves the native `__getattribute__` alone and only consults traits
+    once normal lookup fails, "override" replaces `__getattribute__` outright.
+    Types that already carry a sentinel keep the mode they were installed with.
+    """
+
+    global HOOK_MODE
+
+    if mode not in HOOK_MODES:
+        raise ValueError(f"unknown hook mode {mode!r}, expected one of {', '.join(HOOK_MODES)}")
+
+    HOOK_MODE = mode
+
+
+def set_generic_cache_size(size: int | None):
+    """
+    Keep the `size` most recently created parameterized traits with arguments that can't be weakly referenced
+    (`Trait[int, str]`) alive even when unused. Others are dropped once nothing references them, and rebuilt
+    on the next subscript. `None` keeps every one of them.
+    Traits parameterized by a single type (`From[str]`) are unaffected, they live exactly as long as that type.
+    """
+
+    global GENERIC_KEEPALIVE
+
+    if size is not None and size < 0:
+        raise ValueError(f"generic cache size must be positive, not {size}")
+
+    with REGISTRY_LOCK:
+        GENERIC_KEEPALIVE = deque(GENERIC_KEEPALIVE, maxlen=size)
+
+
+def set_deferred_hooks(enabled: bool = True):
+    """
+    Record impls applied from now on without hooking their target types.
+    Until one of its trait methods is first looked up (on the type or one of its instances) a type only
+    holds stand-ins for those methods, so types whose trait methods are never used keep their native
+    attribute access. Impls on `object` and on classes defined in Python are never deferred, they hook nothing.
+    Queries like `has_trait` and `Trait(type)` see deferred impls without installing them.
+    """
+
+    global DEFER_HOOKS
+
+    DEFER_HOOKS = enabled
+
+
+def install_deferred():
+    """
+    Install every impl recorded while hooks were deferred.
+    """
+
+    with REGISTRY_LOCK:
+        for target in tuple(PENDING.keys()):
+            install_pending(target)
+
+
+def freeze():
+    """
+    Compile every sentinel into a flat dispatch table, resolving ambiguity once.
+    Deferred impls are installed first. Registering impls afterwards raises until `thaw` is called.
+    """
+
+    global FROZEN
+
+    with REGISTRY_LOCK:
+        install_deferred()
+
+        for sentinel in installed_sentinels():
+            if not FROZEN:
+                sentinel.freeze()
+
+        FROZEN = True
+
+
+def thaw():
+    """
+    Undo `freeze`, allowing impls to be registered again.
+    """
+
+    global FROZEN
+
+    with REGISTRY_LOCK:
+        if FROZEN:
+            for sentinel in installed_sentinels():
+                sentinel.thaw()
+
+        FROZEN = False
+
+
+def enable_type_hook():
+    """
+    Make trait methods reachable from the types themselves (`str.red`), installing the
+    process-wide `type` hook now and whenever a new sentinel is created.
+    """
+
+    global TYPE_HOOK_AUTO
+
+    TYPE_HOOK_AUTO = True
+    install_type_hook()
+
+
+def disable_type_hook():
+    """
+    Remove the process-wide `type` hook, restoring native class attribute access.
+    Trait methods stay reachable on instances and through `Trait(type)`.
+    """
+
+    global TYPE_HOOK_AUTO
+
+    TYPE_HOOK_AUTO = False
+    uninstall_type_hook()
+
+
+@contextmanager
+def type_hook():
+    """
+    Enable the `type` hook for the duration of a `with` block only.
+    """
+
+    installed = TYPE_HOOK is None
+    install_type_hook()
+
+    try:
+        yield
+
+    finally:
+        if installed:
+            uninstall_type_hook()
+
+
 def impl(target: ImplTarget):
     def inner(cls):
         if cls.__class__ == TraitImpl:
@@ -335,6 +1787,103 @@ def impl(target: ImplTarget):
 
     return inner
 
+
+def impl_many(trait: Trait, types, impl=None) -> list[TraitImpl]:
+    """
+    Implement `trait` for every type in `types` with the one impl class `impl`, or with the trait's defaults when it's None.
+    Coverage is checked and the defaults copied once for all of them. Returns the `TraitImpl` of each type, in order.
+    """
+
+    targets = [trait >> ty for ty in types]
+
+    if not targets:
+        return []
+
+    shared = targets[0].trait
+
+    if impl is None:
+        impl = derived_impl(shared.inner, targets[0].target, f"{shared.name}Impl", {}, implement_defaults)
+
+    elif impl.__class__ == TraitImpl:
+        impl = impl.impl
+
+    shared._check_coverage(impl)
+
+    objs = [TraitImpl(target, impl, checked=True) for target in targets]
+
+    with REGISTRY_LOCK:
+        if FROZEN:
+            raise RuntimeError(f"cannot apply {impl.__name__}, the trait registry is frozen (see traitor.thaw)")
+
+        # rewritten defaults fall back to a plain lookup on types taking class attributes, sharing them is fine
+        shared._coalesce_methods(impl, devirtualize=not all(takes_class_attributes(obj.target) for obj in objs))
+
+        for obj in objs:
+            obj.install()
+
+    return objs
+
+
+def implement_defaults(trait: Trait, ty: type):
+    impl_many(trait, [ty])
+
+
+def remove_impl(trait: Trait, ty: type):
+    """
+    Undo `impl(trait >> ty)`. Once `ty` has no impls left its hooks are removed,
+    restoring native attribute access on it and on subclasses that only inherited them.
+    """
+
+    with REGISTRY_LOCK:
+        if FROZEN:
+            raise RuntimeError(f"cannot remove {trait} from {ty.__name__}, the trait registry is frozen (see traitor.thaw)")
+
+        if not has_own_impl(ty, trait):
+            raise TypeError(f"{trait} is not implemented for {ty.__name__}")
+
+        if ty in PENDING:
+            if pending := {other: impl for other, impl in PENDING[ty].items() if other is not trait}:
+                PENDING[ty] = pending
+
+            else:
+                del PENDING[ty]
+
+            publish_pending(ty)
+            IMPLEMENTORS[trait].discard(ty)
+            trait._invalidate() # type: ignore
+
+            if not SENTINELS and not PENDING:
+                uninstall_type_hook()
+
+            return
+
+        sentinel = sentinel_of(ty)
+        sentinel.remove_impl(TraitObject(trait))
+
+        if not sentinel.traits:
+            uninstall_sentinel(ty)
+
+def has_own_impl(ty: type, trait: Trait) -> bool:
+    return ((sentinel := sentinel_of(ty)) is not NULL and sentinel.has_impl(trait)) or (ty in PENDING and trait in PENDING[ty])
+
+# The impl of `trait` registered on `ty` itself, or NULL
+def own_impl(ty: type, trait: Trait):
+    if (sentinel := sentinel_of(ty)) is not NULL and trait in sentinel.traits:
+        return sentinel.traits[trait]
+
+    if ty in PENDING and trait in PENDING[ty]:
+        return PENDING[ty][trait]
+
+    return NULL
+
+# Every registered (trait, type, impl), deferred ones included
+def registered_impls() -> list[tuple]:
+    with REGISTRY_LOCK:
+        return [
+            *((trait, sentinel.target, impl) for sentinel in installed_sentinels() for trait, impl in sentinel.traits.items()),
+            *((trait, ty, impl) for ty, pending in list(PENDING.items()) for trait, impl in pending.items()),
+        ]
+
 def derive(*traits: Trait):
     def inner(ty):
         for trait in traits:
@@ -347,11 +1896,159 @@ def derive(*traits: Trait):
 
     return inner
 
-def has_trait(value, trait: TraitObject):
-    if hasattr(value, "__sentinel"):
-        return value.__sentinel.has_impl(trait)
+# Impl classes built at runtime, see `derived_impl`
+class DerivedImpl(type):
+    pass
 
-    return False
+
+def rederive(trait: Trait, ty: type):
+    trait.__derive__(ty) # type: ignore
+
+
+def derived_impl(trait: Trait, target: type, name: str, namespace: dict, recipe=rederive) -> DerivedImpl:
+    """
+    A class named `name` for implementing `trait` on `target` at runtime. It pickles as a reference to that impl,
+    processes without it call `recipe(trait, target)` to register it first; `recipe` must be a module-level function.
+    """
+
+    # `target` held weakly, the impl must not keep it alive
+    return DerivedImpl(name, (object,), {"__module__": trait.__module__, **namespace, "__derived__": (trait, ref(target), recipe)})
+
+
+def restore_derived(trait: Trait, target: type, recipe):
+    with REGISTRY_LOCK:
+        if (impl := own_impl(target, trait)) is NULL:
+            recipe(trait, target)
+            impl = own_impl(target, trait)
+
+    if impl is NULL:
+        raise TypeError(f"{recipe.__qualname__} did not implement {trait} for {target.__name__}")
+
+    return impl
+
+
+def reduce_derived(cls: DerivedImpl):
+    trait, target, recipe = cls.__dict__["__derived__"]
+
+    if (target := target()) is None:
+        raise TypeError(f"cannot pickle {cls.__name__}, its target is gone")
+
+    return restore_derived, (trait, target, recipe)
+
+
+def generic_trait(origin: TraitMeta, subscript: tuple):
+    return TraitMeta.__getitem__(origin, *subscript)
+
+
+# Parameterized traits aren't module globals, they pickle as the subscription that makes them
+def reduce_trait(cls: TraitMeta):
+    if "__origin__" in cls.__dict__:
+        subscript = cls.__dict__["__subscript__"]
+
+        if any(type(arg) is ref and arg() is None for arg in subscript):
+            raise TypeError(f"cannot pickle {cls!r}, its argument is gone")
+
+        return generic_trait, (cls.__dict__["__origin__"], tuple(arg() for arg in subscript))
+
+    return cls.__qualname__
+
+
+copyreg.pickle(TraitMeta, reduce_trait)
+copyreg.pickle(DerivedImpl, reduce_derived)
+
+
+def build_vtable(trait: TraitMeta, ty: type) -> dict:
+    impl = trait(ty)
+
+    return {name: make_provider(getattr(impl, name)) for name in TraitObject(trait).trait_methods}
+
+
+def dyn(trait: Trait, value) -> Dyn:
+    """
+    View `value` through `trait` with every method resolved up front.
+    The vtable is built once per (trait, type) and methods are bound into slots on first use,
+    so repeated calls skip attribute hooks entirely.
+    """
+
+    ty = type(value)
+
+    vtables = trait._vtables
+
+    try:
+        vtable = vtables[id(ty)]
+
+    except KeyError:
+        vtable = vtables.miss(ty, build_vtable, trait, ty)
+
+    if (handle := trait._dyn_class) is None:
+        handle = trait._dyn_class = type(f"dyn {trait}", (Dyn,), {"__slots__": TraitObject(trait).trait_methods})
+
+    return handle(value, vtable)
+
+def has_trait(value, trait: Trait) -> bool:
+    """
+    Whether `value` (a type, or an instance of one) implements `trait`, directly or through a base class.
+    """
+
+    ty = value if isinstance(value, type) else type(value)
+
+    return cached_impl(ty, trait) is not NULL
+
+def has_trait_many(values, trait: Trait) -> list[bool]:
+    """
+    `has_trait` over a batch of values, resolving each distinct type only once.
+    """
+
+    tys = [value if isinstance(value, type) else type(value) for value in values]
+    found = {ty: cached_impl(ty, trait) is not NULL for ty in set(tys)}
+
+    return [found[ty] for ty in tys]
+
+def implementors(trait: Trait) -> frozenset[type]:
+    """
+    Every type `trait` was implemented on. Their subclasses implement it too, but are not listed.
+    """
+
+    return frozenset(IMPLEMENTORS[trait]) if trait in IMPLEMENTORS else frozenset()
+
+def memory_report() -> dict[str, int]:
+    """
+    Size of the trait registry: hooked types, implementations, cached lookups,
+    and roughly how many bytes the registry's own tables take up.
+    """
+
+    with REGISTRY_LOCK:
+        sentinels = installed_sentinels()
+        traits = list(IMPLEMENTORS.keys())
+        pending = list(PENDING.values())
+
+    # trait caches keep what they hold for classes with impls of their own in those classes' sentinels
+    local = [s.type_caches for s in sentinels if isinstance(s, ClassAttributeSentinel)]
+
+    sizeof = sys.getsizeof
+    sentinel_bytes = sum(
+        sizeof(s) + sizeof(s.traits) + sizeof(s.resolved) + sizeof(s.providers) + sizeof(s.cache) + sizeof(s.hooks)
+        + sum(map(sizeof, s.providers.values()))
+        for s in sentinels
+    )
+    trait_bytes = sum(
+        sizeof(t._impl_index) + sizeof(t._vtables) + sum(sizeof(d.cache) for d in t._dispatchers.values())
+        for t in traits
+    ) + sum(sizeof(caches.data) for caches in local)  # type: ignore
+
+    return {
+        "hooked_types": len(sentinels),
+        "frozen_types": sum(isinstance(s, FrozenMethodSentinel) for s in sentinels),
+        "pending_types": len(pending),
+        "traits": len(traits),
+        "impls": sum(len(s.traits) for s in sentinels) + sum(map(len, pending)),
+        "methods": sum(len(s.resolved) for s in sentinels),
+        "ambiguous_methods": sum(len(s.providers) for s in sentinels),
+        "cached_lookups": sum(len(s.cache) for s in sentinels),
+        "cached_resolutions": sum(len(t._impl_index) + len(t._vtables) for t in traits) + sum(map(len, local)),
+        "sentinel_bytes": sentinel_bytes,
+        "trait_cache_bytes": trait_bytes,
+    }
 
 
 
@@ -361,4 +2058,9 @@ def type_wrapper(t, n):
     return TypeLevelSentinel(t, n)
 
 
-hook(type, "__getattribute__")(type_wrapper)
+def type_fallback(t, n):
+    return TypeLevelSentinel.fallback(t, n)
+
+
+from .profiling import trace  # noqa: E402 (needs the names above)
+from .registry import RegistrySnapshot, registry_snapshot  # noqa: E402
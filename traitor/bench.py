@@ -0,0 +1,215 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+"""
+Dispatch overhead benchmarks.
+
+    python -m traitor.bench [--mode fallback|override] [--output FILE] [--compare FILE]
+
+Every case is timed in a fresh interpreter with `traitor.prelude` loaded, and again against a baseline.
+Native lookups, conversions and trait lookups are compared with the same code in an interpreter that
+never imported traitor. Trait method calls are compared with calling the impl's function directly,
+which is exactly the dispatch cost. Results are written as JSON, `--compare` adds the change
+against an earlier run.
+"""
+
+from __future__ import annotations
+
+__all__ = ("run", "main")
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+VERSION = 1
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# shared by both interpreters
+SETUP = """
+class Plain:
+    x = 1
+
+class Foo:
+    def __init__(self, value):
+        self.value = value
+
+s = "abc"
+xs = [1, 2, 3]
+f = str
+IMPLS = {str: Plain}
+"""
+
+TRAITOR_SETUP = """
+import traitor
+traitor.set_hook_mode(MODE)
+
+from traitor.prelude import *
+
+traitor.enable_type_hook()
+
+@impl(From[str] >> Foo)
+class FooFromStr:
+    def from_(value):
+        return Foo(value)
+
+# looked up through the trait, defaults come back already rewritten; the baseline calls what the hooks call
+map_ = AdvancedIterator(list).map
+fmt = Debug(str).fmt
+red = Colorize(str).red
+assert all(type(fn) is type(lambda: None) for fn in (map_, fmt, red))
+"""
+
+WORKER = """
+import json, sys, timeit
+
+MODE, REPEAT = sys.argv[1], int(sys.argv[2])
+CASES = json.loads(sys.argv[3])
+
+exec(compile(sys.argv[4], "<setup>", "exec"))
+
+results = {}
+
+for name, stmt in CASES.items():
+    timer = timeit.Timer(stmt, globals=globals())
+    number, _ = timer.autorange()
+    results[name] = min(timer.repeat(REPEAT, number)) / number * 1e9
+
+print(json.dumps(results))
+"""
+
+# name -> (statement with traitor, baseline statement, whether the baseline runs with traitor loaded)
+CASES = {
+    "native.str_attr": ("s.upper", "s.upper", False),
+    "native.list_attr": ("xs.append", "xs.append", False),
+    "native.class_attr": ("Plain.x", "Plain.x", False),
+    "native.builtin_type_attr": ("str.upper", "str.upper", False),
+    "trait.map": ("xs.map(f)", "map_(xs, f)", True),
+    "trait.fmt": ("s.fmt()", "fmt(s)", True),
+    "trait.red": ("s.red()", "red(s)", True),
+    "lookup.trait_of_type": ("Debug(str)", "IMPLS[str]", False),
+    "convert.into": ("s.into()", "Foo(s)", False),
+    "convert.from": ("From[str](Foo).from_(s)", "Foo(s)", False),
+}
+
+
+def environment() -> dict:
+    path = os.environ.get("PYTHONPATH")
+
+    return {**os.environ, "PYTHONPATH": ROOT if not path else os.pathsep.join((ROOT, path))}
+
+
+def interpreter(code: str, *args: str) -> str:
+    return subprocess.run(
+        (sys.executable, "-c", code, *args), env=environment(), check=True, capture_output=True, text=True
+    ).stdout
+
+
+def time_cases(cases: dict, setup: str, mode: str, repeat: int) -> dict[str, float]:
+    return json.loads(interpreter(WORKER, mode, str(repeat), json.dumps(cases), setup))
+
+
+# Best wall time of starting an interpreter that runs `code`, in nanoseconds
+def time_startup(code: str, repeat: int) -> float:
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        interpreter(code)
+        times.append(time.perf_counter_ns() - start)
+
+    return min(times)
+
+
+def commit() -> str | None:
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "HEAD"), cwd=ROOT, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(mode: str = "fallback", repeat: int = 5) -> dict:
+    """
+    Run every benchmark and return the results, timings are per operation in nanoseconds.
+    """
+
+    setup = SETUP + TRAITOR_SETUP
+
+    hooked = time_cases({name: stmt for name, (stmt, _, _) in CASES.items()}, setup, mode, repeat)
+    loaded = time_cases({name: base for name, (_, base, traitor) in CASES.items() if traitor}, setup, mode, repeat)
+    plain = time_cases({name: base for name, (_, base, traitor) in CASES.items() if not traitor}, SETUP, mode, repeat)
+
+    baseline = {**loaded, **plain}
+    baseline["import.prelude"] = time_startup("pass", repeat)
+    hooked["import.prelude"] = time_startup("import traitor.prelude", repeat)
+
+    return {
+        "version": VERSION,
+        "commit": commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "hook_mode": mode,
+        "results": {
+            name: {
+                "traitor_ns": round(ns, 1),
+                "baseline_ns": round(baseline[name], 1),
+                "overhead": round(ns / baseline[name], 2),
+            }
+            for name, ns in hooked.items()
+        },
+    }
+
+
+# traitor_ns now relative to `previous`, for the cases both runs have
+def compare(current: dict, previous: dict) -> dict[str, float]:
+    before = previous["results"]
+
+    return {
+        name: round(result["traitor_ns"] / before[name]["traitor_ns"], 2)
+        for name, result in current["results"].items()
+        if name in before
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m traitor.bench", description="Measure traitor's dispatch overhead.")
+    parser.add_argument("--mode", choices=("fallback", "override"), default="fallback", help="hook mode to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per case, the best is kept")
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--compare", help="earlier results to compare against")
+
+    args = parser.parse_args(argv)
+
+    previous = None
+
+    # read up front so a bad path fails before the benchmarks run
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+
+    results = run(args.mode, args.repeat)
+
+    if previous is not None:
+        results["compare"] = {"commit": previous.get("commit"), "change": compare(results, previous)}
+
+    text = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+"""
+Static binding of `self.method(...)` calls inside trait default methods.
+
+A default like `take` calls `self.islice(n)`, which goes through the attribute hooks of `self`'s type
+on every call. `rewrite` recompiles such a function so each of those calls reads
+
+    __impl_islice(self, n) if __type(self) in __ok_islice else __miss(self, "islice", __ok_islice, __impl_islice)(n)
+
+with the `__*` names left as free variables for the caller to `bind`. Functions that can't be
+rewritten faithfully (no source, closures, decorators, a rebound `self`, names that would be mangled)
+are left alone.
+"""
+
+from __future__ import annotations
+
+__all__ = ("rewrite", "bind")
+
+import __future__
+
+import ast
+import inspect
+import textwrap
+import tokenize
+from types import FunctionType
+from weakref import WeakKeyDictionary
+
+# code object -> (compiled factory, free variable names), or None when it can't be rewritten
+TEMPLATES = WeakKeyDictionary()
+
+
+class SelfCalls(ast.NodeTransformer):
+    def __init__(self, receiver: str, names):
+        self.receiver = receiver
+        self.names = names
+        self.found = set()
+
+    # nested scopes may rebind the receiver, leave them be
+    def visit_FunctionDef(self, node: ast.AST) -> ast.AST:
+        return node
+
+    visit_AsyncFunctionDef = visit_Lambda = visit_ClassDef = visit_FunctionDef
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+
+        func = node.func
+
+        if not (
+            isinstance(func, ast.Attribute)
+            and isinstance(func.value, ast.Name)
+            and func.value.id == self.receiver
+            and func.attr in self.names
+        ):
+            return node
+
+        name = func.attr
+        self.found.add(name)
+
+        def load(id):
+            return ast.Name(id=id, ctx=ast.Load())
+
+        fast = ast.Call(func=load(f"__impl_{name}"), args=[load(self.receiver), *node.args], keywords=node.keywords)
+        slow = ast.Call(
+            func=ast.Call(
+                func=load("__miss"),
+                args=[load(self.receiver), ast.Constant(value=name), load(f"__ok_{name}"), load(f"__impl_{name}")],
+                keywords=[],
+            ),
+            args=node.args,
+            keywords=node.keywords,
+        )
+        test = ast.Compare(
+            left=ast.Call(func=load("__type"), args=[load(self.receiver)], keywords=[]),
+            ops=[ast.In()],
+            comparators=[load(f"__ok_{name}")],
+        )
+
+        return ast.copy_location(ast.IfExp(test=test, body=fast, orelse=slow), node)
+
+
+# names the compiler would mangle inside the trait's class body, but not in our module-level factory
+def mangled(node) -> bool:
+    for child in ast.walk(node):
+        name = child.id if isinstance(child, ast.Name) else child.attr if isinstance(child, ast.Attribute) else None
+
+        if name is not None and name.startswith("__") and not name.endswith("__"):
+            return True
+
+    return False
+
+
+def template(fn: FunctionType, names):
+    code = fn.__code__
+
+    if fn.__closure__ or not code.co_argcount:
+        return None
+
+    # no source, or source that changed since the function was compiled
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(fn)))
+
+    except (OSError, TypeError, IndexError, SyntaxError, tokenize.TokenError):
+        return None
+
+    func = tree.body[0] if tree.body else None
+
+    if (
+        not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef))
+        or func.name != code.co_name
+        or func.decorator_list
+        or mangled(func)
+    ):
+        return None
+
+    receiver = (func.args.posonlyargs + func.args.args)[0].arg
+
+    if any(
+        isinstance(node, ast.Name) and node.id == receiver and not isinstance(node.ctx, ast.Load)
+        for node in ast.walk(func)
+    ):
+        return None
+
+    calls = SelfCalls(receiver, names)
+    func.body = [calls.visit(stmt) for stmt in func.body]
+
+    if not calls.found:
+        return None
+
+    free = ("__type", "__miss", *(f"__{kind}_{name}" for name in sorted(calls.found) for kind in ("ok", "impl")))
+
+    # def __factory(<free>): <func>; return <func>
+    factory = ast.FunctionDef(
+        name="__factory",
+        args=ast.arguments(
+            posonlyargs=[], args=[ast.arg(arg=name) for name in free], kwonlyargs=[], kw_defaults=[], defaults=[]
+        ),
+        body=[func, ast.Return(value=ast.Name(id=func.name, ctx=ast.Load()))],
+        decorator_list=[],
+        lineno=1,
+    )
+
+    module = ast.fix_missing_locations(ast.Module(body=[factory], type_ignores=[]))
+    ast.increment_lineno(module, code.co_firstlineno - 1)
+
+    # annotations were evaluated with the original, don't do it again
+    try:
+        compiled = compile(
+            module, code.co_filename, "exec", flags=__future__.annotations.compiler_flag, dont_inherit=True
+        )
+
+    except (SyntaxError, ValueError):
+        return None
+
+    return compiled, free
+
+
+def rewrite(fn: FunctionType, names) -> FunctionType | None:
+    """
+    A copy of `fn` with its `self.<name>(...)` calls, for every name in `names`, statically bound; or None.
+    Its free variables are unset until `bind` fills them in.
+    """
+
+    code = fn.__code__
+
+    if code not in TEMPLATES:
+        TEMPLATES[code] = template(fn, frozenset(names))
+
+    if (compiled := TEMPLATES[code]) is None:
+        return None
+
+    compiled, free = compiled
+    namespace = {}
+
+    exec(compiled, fn.__globals__, namespace)
+
+    new = namespace["__factory"](*(None for _ in free))
+
+    new.__defaults__ = fn.__defaults__
+    new.__kwdefaults__ = fn.__kwdefaults__
+    new.__annotations__ = fn.__annotations__
+    new.__qualname__ = fn.__qualname__
+    new.__module__ = fn.__module__
+    new.__doc__ = fn.__doc__
+    new.__dict__.update(fn.__dict__)
+
+    return new
+
+
+def bind(fn: FunctionType, value):
+    """
+    Set each free variable of a rewritten `fn` to `value(name)`.
+    """
+
+    for name, cell in zip(fn.__code__.co_freevars, fn.__closure__ or ()):
+        cell.cell_contents = value(name)
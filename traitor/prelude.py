@@ -8,8 +8,12 @@ from __future__ import annotations
 
 __all__ = (
     "derive",
+    "dyn",
     "has_trait",
+    "has_trait_many",
     "impl",
+    "impl_many",
+    "implementors",
     "ColoredString",
     "Colorize",
     "Debug",
@@ -23,7 +27,7 @@ __all__ = (
     "Default",
 )
 
-from . import derive, has_trait, impl
+from . import derive, dyn, has_trait, has_trait_many, impl, impl_many, implementors
 from .traits.colored import ColoredString, Colorize
 from .traits.debug import Debug
 from .traits.default import Default
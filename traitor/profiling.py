@@ -0,0 +1,252 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+"""
+Tracing of trait dispatch.
+
+    with traitor.trace("dispatch.json", sample=0.01):
+        serve()
+
+Inside the block every trait method resolved off an instance is recorded along with its call, and so is
+every `Trait(type)` lookup, each with the type, trait, impl and wall time. `sample` is the share of them
+that get recorded. The trace is written as Chrome trace events (load it in chrome://tracing or Perfetto),
+or with `format="pstats"` as a file `pstats.Stats` reads. Tracing covers every thread while the block runs.
+"""
+
+from __future__ import annotations
+
+__all__ = ("trace", "Tracer")
+
+import json
+import marshal
+import os
+import random
+import threading
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+import traitor
+
+from . import NULL, REGISTRY_LOCK, AmbiguousMethod, cached_impl, republish, sentinel_of
+
+FORMATS = ("chrome", "pstats")
+
+
+# What a traced lookup resolved to, as names
+class Site:
+    __slots__ = "type", "trait", "impl", "method"
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, ty: str, trait: str, impl: str, method: str):
+        self.type = ty
+        self.trait = trait
+        self.impl = impl
+        self.method = method
+
+    @property
+    def name(self) -> str:
+        return f"{self.trait}.{self.method}"
+
+    def args(self) -> dict:
+        return {"type": self.type, "trait": self.trait, "impl": self.impl, "method": self.method}
+
+
+# A sampled trait method, its calls are timed
+class TracedCall:
+    __slots__ = "tracer", "site", "method"
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, tracer: Tracer, site: Site, method):
+        self.tracer = tracer
+        self.site = site
+        self.method = method
+
+    def __call__(self, *args, **kwargs):
+        tracer = self.tracer
+        stack = tracer.stack()
+        stack.append(0)
+        start = perf_counter_ns()
+
+        try:
+            return self.method(*args, **kwargs)
+
+        finally:
+            duration = perf_counter_ns() - start
+            children = stack.pop()
+
+            if stack:
+                stack[-1] += duration
+
+            tracer.record("call", self.site, start, duration, duration - children)
+
+    def __repr__(self):
+        return f"TracedCall<{self.method!r}>"
+
+
+class Tracer:
+    """
+    Recorder behind `trace()`. `events` holds (kind, site, start ns, duration ns, own ns, thread id) tuples.
+    """
+
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, sample: float = 1.0):
+        self.sample = sample
+        self.events = []
+        self.sites = {}
+        self.local = threading.local()
+        self.origin = perf_counter_ns()
+
+    def sampled(self) -> bool:
+        return self.sample >= 1.0 or random.random() < self.sample
+
+    # durations of the traced calls running on this thread, innermost last
+    def stack(self) -> list:
+        try:
+            return self.local.stack
+
+        except AttributeError:
+            stack = self.local.stack = []
+
+            return stack
+
+    def record(self, kind: str, site: Site, start: int, duration: int, own: int):
+        self.events.append((kind, site, start - self.origin, duration, own, threading.get_ident()))
+
+    def site(self, sentinel, ty: type, key: str) -> Site:
+        try:
+            return self.sites[(ty, key)]
+
+        except KeyError:
+            pass
+
+        trait = impl = "?"
+
+        for base in ty.__mro__:
+            if (owner := sentinel_of(base)) is not NULL and key in owner.resolved:
+                if type(owner.resolved[key]) is not AmbiguousMethod:
+                    provider = owner.provider_of(key)
+                    trait, impl = str(provider), owner.traits[provider].__qualname__
+
+                break
+
+        site = self.sites[(ty, key)] = Site(ty.__qualname__, trait, impl, key)
+
+        return site
+
+    # Called by sentinels in place of `method.__get__(val, sentinel.target)`
+    def bind(self, sentinel, val, key: str, method):
+        if not self.sampled():
+            return method.__get__(val, sentinel.target)
+
+        start = perf_counter_ns()
+        bound = method.__get__(val, sentinel.target)
+        duration = perf_counter_ns() - start
+
+        site = self.site(sentinel, type(val), key)
+        self.record("resolve", site, start, duration, duration)
+
+        return TracedCall(self, site, bound) if callable(bound) else bound
+
+    # Called by `Trait(ty)`
+    def lookup(self, trait, ty: type):
+        if not self.sampled():
+            return cached_impl(ty, trait)
+
+        start = perf_counter_ns()
+        impl = cached_impl(ty, trait)
+        duration = perf_counter_ns() - start
+
+        name = "<missing>" if impl is NULL else impl.__qualname__
+        self.record("resolve", Site(ty.__qualname__, str(trait), name, "<impl>"), start, duration, duration)
+
+        return impl
+
+    def chrome(self) -> dict:
+        """
+        The events in Chrome's trace event format.
+        """
+
+        pid = os.getpid()
+
+        return {
+            "traceEvents": [
+                {
+                    "name": site.name,
+                    "cat": kind,
+                    "ph": "X",
+                    "ts": start / 1000,
+                    "dur": duration / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": site.args(),
+                }
+                for kind, site, start, duration, _, tid in self.events
+            ],
+            "displayTimeUnit": "ns",
+        }
+
+    def pstats(self) -> dict:
+        """
+        The events aggregated per (trait, method, impl, type) in the layout `pstats.Stats` loads.
+        """
+
+        stats = {}
+
+        for kind, site, _, duration, own, _ in self.events:
+            key = (
+                f"{site.trait} [{site.impl} for {site.type}]",
+                0,
+                site.method if kind == "call" else f"<resolve {site.method}>",
+            )
+            calls, _, tottime, cumtime, callers = stats.get(key, (0, 0, 0.0, 0.0, {}))
+            stats[key] = (calls + 1, calls + 1, tottime + own / 1e9, cumtime + duration / 1e9, callers)
+
+        return stats
+
+    def save(self, path: str | os.PathLike, format: str = "chrome"):
+        if format == "chrome":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.chrome(), f)
+
+        else:
+            with open(path, "wb") as f:
+                marshal.dump(self.pstats(), f)
+
+
+@contextmanager
+def trace(path: str | os.PathLike | None = None, *, format: str = "chrome", sample: float = 1.0):
+    """
+    Record trait dispatch inside the block, writing it to `path` on the way out as `format` ("chrome" or "pstats").
+    Only `sample` (0 to 1) of the resolutions are recorded. Yields the `Tracer`.
+    """
+
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+
+    if not 0.0 < sample <= 1.0:
+        raise ValueError("sample must be above 0 and at most 1")
+
+    tracer = Tracer(sample)
+
+    with REGISTRY_LOCK:
+        if traitor.TRACER is not None:
+            raise RuntimeError("a trace is already running")
+
+        traitor.TRACER = tracer
+        # class attribute lookups never reach a sentinel unless told to
+        republish()
+
+    try:
+        yield tracer
+
+    finally:
+        with REGISTRY_LOCK:
+            traitor.TRACER = None
+            republish()
+
+        if path is not None:
+            tracer.save(path, format)
@@ -0,0 +1,110 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+"""
+Picklable snapshots of the trait registry, for handing it to worker processes.
+
+    registry = traitor.registry_snapshot()
+
+    with ProcessPoolExecutor(mp_context=get_context("spawn"), initializer=registry.restore) as pool:
+        ...
+
+A snapshot names the modules impls were registered from, which `restore` imports, and carries every impl
+that importing those modules wouldn't register by itself: impls registered at runtime, derived impls and
+generic trait impls. Impls whose class or type can't be found by name outside the process are left out.
+"""
+
+from __future__ import annotations
+
+__all__ = ("RegistrySnapshot", "registry_snapshot")
+
+import importlib
+import sys
+
+from . import (
+    REGISTRY_LOCK,
+    DerivedImpl,
+    ImplTarget,
+    TraitImpl,
+    TraitObject,
+    has_own_impl,
+    registered_impls,
+)
+
+
+# The object `module.qualname` refers to, with impls unwrapped from the `TraitImpl` `@impl` leaves behind
+def resolve(module: str, qualname: str):
+    obj = sys.modules[module] if module in sys.modules else importlib.import_module(module)
+
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+
+    return obj.impl if obj.__class__ == TraitImpl else obj
+
+
+# Whether `obj` can be found again as `obj.__module__` `obj.__qualname__` in another process
+def named(obj) -> bool:
+    try:
+        return "<locals>" not in obj.__qualname__ and resolve(obj.__module__, obj.__qualname__) is obj
+
+    except (AttributeError, ImportError, KeyError):
+        return False
+
+
+class RegistrySnapshot:
+    """
+    The impls registered when it was taken, see `registry_snapshot`.
+    `impls` holds (trait, type, impl) with named impls as (module, qualname) pairs.
+    """
+
+    __slots__ = "modules", "impls"
+
+    def __init__(self, modules: tuple[str, ...], impls: tuple[tuple, ...]):
+        self.modules = modules
+        self.impls = impls
+
+    def restore(self):
+        """
+        Import the modules the impls came from and register the impls still missing afterwards.
+        """
+
+        for module in self.modules:
+            importlib.import_module(module)
+
+        with REGISTRY_LOCK:
+            for trait, target, impl in self.impls:
+                if not has_own_impl(target, trait):
+                    if impl.__class__ == tuple:
+                        impl = resolve(*impl)
+
+                    # not `trait >> target`, the impls a `__reciprocal__` would add are in the snapshot already
+                    TraitImpl(ImplTarget(TraitObject(trait), target), impl).apply()
+
+    def __repr__(self):
+        return f"<registry snapshot of {len(self.impls)} impls from {len(self.modules)} modules>"
+
+
+def registry_snapshot() -> RegistrySnapshot:
+    """
+    The trait registry as it is now, in a form that pickles. Call `.restore()` on it in another process to register the same impls there.
+    """
+
+    modules = set()
+    impls = []
+
+    for trait, target, impl in registered_impls():
+        modules.update((trait.__module__, impl.__module__))
+
+        if not ("__origin__" in trait.__dict__ or named(trait)) or not named(target):
+            continue
+
+        if impl.__class__ == DerivedImpl:
+            impls.append((trait, target, impl))
+
+        elif named(impl):
+            impls.append((trait, target, (impl.__module__, impl.__qualname__)))
+
+    modules.discard("builtins")
+
+    return RegistrySnapshot(tuple(sorted(modules)), tuple(impls))
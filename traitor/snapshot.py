@@ -0,0 +1,157 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+"""
+On-disk cache of trait and impl introspection.
+
+    traitor.snapshot.load(".traitor-snapshot")
+    import traitor.prelude
+    traitor.snapshot.save(".traitor-snapshot")
+
+Entries are keyed by the hash of the source file that defined the class, the class's qualified name,
+its bases and its own namespace, and the hashes of the files its bases came from. Editing a file only
+drops the entries of classes defined or inheriting from there.
+"""
+
+from __future__ import annotations
+
+__all__ = ("load", "save", "impl_map")
+
+import hashlib
+import json
+import os
+import sys
+
+VERSION = 3
+
+# None until `load` is called, then {path: {kind: {key: value}}}
+ACTIVE = None
+IMPL_MAP = []
+
+FILE_HASHES = {}
+
+
+def file_hash(path: str) -> str | None:
+    if path not in FILE_HASHES:
+        try:
+            with open(path, "rb") as f:
+                FILE_HASHES[path] = hashlib.sha256(f.read()).hexdigest()
+
+        except OSError:
+            FILE_HASHES[path] = None
+
+    return FILE_HASHES[path]
+
+
+def class_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def source_path(cls: type) -> str | None:
+    return getattr(sys.modules.get(cls.__module__), "__file__", None)
+
+
+# (source path, key) for `cls`, or None when it has no source file to hash.
+# Introspection sees inherited members too, so the key carries the hashes of every base's file
+def class_key(cls: type):
+    if (path := source_path(cls)) is None:
+        return None
+
+    bases = ",".join(map(class_name, cls.__bases__))
+    names = ",".join(cls.__dict__.keys())
+    sources = ",".join(
+        sorted({str(file_hash(base_path)) for base in cls.__mro__[1:] if (base_path := source_path(base)) is not None})
+    )
+
+    return path, f"{cls.__qualname__}({bases})[{names}]{{{sources}}}"
+
+
+def lookup(kind: str, cls: type, compute):
+    """
+    `compute()`, or its cached result for `cls` while a snapshot is loaded.
+    """
+
+    if ACTIVE is None or (key := class_key(cls)) is None:
+        return compute()
+
+    path, key = key
+    entries = ACTIVE.setdefault(path, {}).setdefault(kind, {})
+
+    if key not in entries:
+        entries[key] = compute()
+
+    return entries[key]
+
+
+def record_impl(trait, target: type, impl: type):
+    if ACTIVE is not None:
+        IMPL_MAP.append((str(trait), class_name(target), class_name(impl)))
+
+
+def load(path: str | os.PathLike) -> bool:
+    """
+    Start serving introspection results from the snapshot at `path`, and recording new ones for `save`.
+    Entries from source files that changed since are dropped. Returns whether anything was loaded.
+    """
+
+    global ACTIVE, IMPL_MAP
+
+    ACTIVE = {}
+    IMPL_MAP = []
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    except (OSError, ValueError):
+        return False
+
+    if data.get("version") != VERSION:
+        return False
+
+    for source, entries in data["entries"].items():
+        if file_hash(source) != data["files"].get(source):
+            continue
+
+        # json hands back lists, callers expect the tuples they computed
+        ACTIVE[source] = {
+            "trait_methods": {key: tuple(map(tuple, value)) for key, value in entries.get("trait_methods", {}).items()},
+            "routines": {key: tuple(value) for key, value in entries.get("routines", {}).items()},
+        }
+
+    IMPL_MAP = [tuple(entry) for entry in data["impls"]]
+
+    return bool(ACTIVE)
+
+
+def save(path: str | os.PathLike):
+    """
+    Write everything looked up since `load` to `path`.
+    """
+
+    if ACTIVE is None:
+        raise RuntimeError("no snapshot is active, call traitor.snapshot.load first")
+
+    files = {source: file_hash(source) for source in ACTIVE}
+    data = {
+        "version": VERSION,
+        "files": {source: digest for source, digest in files.items() if digest is not None},
+        "entries": {source: entries for source, entries in ACTIVE.items() if files[source] is not None},
+        "impls": sorted(set(IMPL_MAP)),
+    }
+
+    tmp = f"{os.fspath(path)}.{os.getpid()}.tmp"
+
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    os.replace(tmp, path)
+
+
+def impl_map() -> list[tuple[str, str, str]]:
+    """
+    (trait, type, impl) names of every impl registered since, or loaded by, `load`.
+    """
+
+    return sorted(set(IMPL_MAP))
@@ -0,0 +1,279 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2022 AnonymousDapper
+
+"""
+Opt-in counters for attribute lookups that go through traitor's hooks.
+
+    import traitor.stats
+    traitor.stats.enable(timing=True, sample=10)
+    ...
+    traitor.stats.disable()
+    traitor.stats.report()
+    traitor.stats.dump("dispatch.prof")  # pstats.Stats("dispatch.prof")
+
+Lookups are counted per (type, attribute) as native hits, trait hits or misses. In fallback mode
+native hits never reach the hooks, so only trait hits and misses show up; classes that get their trait
+methods as class attributes (and `object`) only report trait hits.
+Enabling swaps the sentinels' classes, so nothing is left running once disabled.
+"""
+
+from __future__ import annotations
+
+__all__ = ("enable", "disable", "reset", "report", "dump")
+
+import marshal
+import os
+from time import perf_counter_ns
+
+import traitor
+
+from . import (
+    HAS_ATTRIBUTE,
+    METHOD_NAMES,
+    NATIVE,
+    NULL,
+    REGISTRY_LOCK,
+    AmbiguousMethod,
+    ClassAttributeSentinel,
+    FrozenMethodSentinel,
+    MethodSentinel,
+    TypeLevelSentinel,
+    installed_sentinels,
+    republish,
+    sentinel_of,
+)
+
+# indices into a counter
+NATIVE_HITS, TRAIT_HITS, MISSES, TIMED, NANOSECONDS = range(5)
+
+# (type, name) -> counter, for lookups on instances and on the types themselves.
+# Types seen while enabled are kept alive until `reset`
+COUNTS = {}
+TYPE_COUNTS = {}
+
+ENABLED = False
+TIMING = False
+SAMPLE = 1
+
+
+# Nothing in the hooks below may look attributes up on builtins, they may be hooked too
+def counter(counts: dict, ty: type, key: str) -> list:
+    try:
+        return counts[(ty, key)]
+
+    except KeyError:
+        c = counts[(ty, key)] = [0, 0, 0, 0, 0]
+
+        return c
+
+
+def timed(c: list) -> bool:
+    return TIMING and (c[NATIVE_HITS] + c[TRAIT_HITS] + c[MISSES]) % SAMPLE == 0
+
+
+# Counts one call of `lookup(sentinel, val, key)`, `kind(sentinel, val, key)` tells a native hit from a trait hit
+def measure(counts, ty, lookup, kind, sentinel, val, key):
+    c = counter(counts, ty, key)
+    start = perf_counter_ns() if timed(c) else 0
+
+    try:
+        attr = lookup(sentinel, val, key)
+
+    except AttributeError:
+        c[MISSES] += 1
+        raise
+
+    else:
+        c[kind(sentinel, val, key)] += 1
+
+        return attr
+
+    finally:
+        if start:
+            c[TIMED] += 1
+            c[NANOSECONDS] += perf_counter_ns() - start
+
+
+def cached_kind(sentinel, val, key) -> int:
+    cache = sentinel.cache
+
+    return TRAIT_HITS if key in METHOD_NAMES and key in cache and cache[key] is not NATIVE else NATIVE_HITS
+
+
+def frozen_kind(sentinel, val, key) -> int:
+    return NATIVE_HITS if sentinel.lookup(key, NATIVE) is NATIVE else TRAIT_HITS
+
+
+# past a fallback hook the native lookup has already failed
+def trait_kind(sentinel, val, key) -> int:
+    return TRAIT_HITS
+
+
+def type_kind(sentinel, ty, key) -> int:
+    return NATIVE_HITS if HAS_ATTRIBUTE(ty, key) is not NULL else TRAIT_HITS
+
+
+class InstrumentedMethodSentinel(MethodSentinel):
+    __slots__ = ()
+
+    def __call__(self, val, key, lookup=MethodSentinel.__call__):
+        return measure(COUNTS, type(val), lookup, cached_kind, self, val, key)
+
+    def fallback(self, val, key, lookup=MethodSentinel.fallback):
+        return measure(COUNTS, type(val), lookup, trait_kind, self, val, key)
+
+    def freeze(self: MethodSentinel):
+        MethodSentinel.freeze(self)
+
+        self.__class__ = InstrumentedFrozenMethodSentinel
+
+
+class InstrumentedFrozenMethodSentinel(FrozenMethodSentinel):
+    __slots__ = ()
+
+    def __call__(self, val, key, lookup=FrozenMethodSentinel.__call__):
+        return measure(COUNTS, type(val), lookup, frozen_kind, self, val, key)
+
+    def fallback(self, val, key, lookup=FrozenMethodSentinel.fallback):
+        return measure(COUNTS, type(val), lookup, trait_kind, self, val, key)
+
+    def thaw(self: MethodSentinel):
+        FrozenMethodSentinel.thaw(self)
+
+        self.__class__ = InstrumentedMethodSentinel
+
+
+# Publishes stand-ins in place of its methods, so their lookups come through `fallback`
+class InstrumentedClassAttributeSentinel(ClassAttributeSentinel):
+    __slots__ = ()
+
+    counted = True
+
+    def fallback(self, val, key, lookup=ClassAttributeSentinel.fallback):
+        return measure(COUNTS, type(val), lookup, trait_kind, self, val, key)
+
+
+TypeSentinel = type(TypeLevelSentinel)
+
+
+class InstrumentedTypeSentinel(TypeSentinel):
+    def __call__(self, ty, key, lookup=TypeSentinel.__call__):
+        return measure(TYPE_COUNTS, ty, lookup, type_kind, self, ty, key)
+
+    def fallback(self, ty, key, lookup=TypeSentinel.fallback):
+        return measure(TYPE_COUNTS, ty, lookup, trait_kind, self, ty, key)
+
+
+INSTRUMENTED = {
+    MethodSentinel: InstrumentedMethodSentinel,
+    FrozenMethodSentinel: InstrumentedFrozenMethodSentinel,
+    ClassAttributeSentinel: InstrumentedClassAttributeSentinel,
+    TypeSentinel: InstrumentedTypeSentinel,
+}
+PLAIN = {instrumented: plain for plain, instrumented in INSTRUMENTED.items()}
+
+
+def swap(classes: dict):
+    for sentinel in (*installed_sentinels(), TypeLevelSentinel):
+        sentinel.__class__ = classes.get(type(sentinel), type(sentinel))
+
+    traitor.SENTINEL_TYPE = classes.get(traitor.SENTINEL_TYPE, traitor.SENTINEL_TYPE)
+    traitor.CLASS_SENTINEL_TYPE = classes.get(traitor.CLASS_SENTINEL_TYPE, traitor.CLASS_SENTINEL_TYPE)
+
+    republish()
+
+
+def enable(timing: bool = False, sample: int = 1):
+    """
+    Start counting hooked lookups. With `timing`, every `sample`th lookup of each (type, attribute) is timed.
+    """
+
+    global ENABLED, TIMING, SAMPLE
+
+    if sample < 1:
+        raise ValueError("sample must be at least 1")
+
+    with REGISTRY_LOCK:
+        TIMING = timing
+        SAMPLE = sample
+
+        if not ENABLED:
+            swap(INSTRUMENTED)
+            ENABLED = True
+
+
+def disable():
+    """
+    Stop counting, the collected counts are kept.
+    """
+
+    global ENABLED
+
+    with REGISTRY_LOCK:
+        if ENABLED:
+            swap(PLAIN)
+            ENABLED = False
+
+
+def reset():
+    """
+    Forget every count collected so far.
+    """
+
+    COUNTS.clear()
+    TYPE_COUNTS.clear()
+
+
+# The trait providing `name` to `ty`, as a string
+def provider_name(ty: type, name: str) -> str | None:
+    for base in ty.__mro__:
+        if (sentinel := sentinel_of(base)) is not NULL and name in sentinel.resolved:
+            if type(sentinel.resolved[name]) is AmbiguousMethod:
+                return "<ambiguous>"
+
+            return str(sentinel.provider_of(name))
+
+    return None
+
+
+def report() -> dict[tuple[str, str], dict]:
+    """
+    Counts keyed by (type, attribute), busiest first. Lookups on the types themselves are listed as `type[name]`.
+    `seconds` is extrapolated from the timed samples, None when nothing was timed.
+    """
+
+    rows = [
+        *((ty.__qualname__, ty, key, c[:]) for (ty, key), c in list(COUNTS.items())),
+        *((f"type[{ty.__qualname__}]", ty, key, c[:]) for (ty, key), c in list(TYPE_COUNTS.items())),
+    ]
+
+    result = {}
+
+    for label, ty, key, c in sorted(rows, key=lambda row: -sum(row[3][:TIMED])):
+        calls = c[NATIVE_HITS] + c[TRAIT_HITS] + c[MISSES]
+
+        result[(label, key)] = {
+            "trait": provider_name(ty, key) if c[TRAIT_HITS] else None,
+            "calls": calls,
+            "native": c[NATIVE_HITS],
+            "trait_hits": c[TRAIT_HITS],
+            "misses": c[MISSES],
+            "seconds": c[NANOSECONDS] / c[TIMED] * calls / 1e9 if c[TIMED] else None,
+        }
+
+    return result
+
+
+def dump(path: str | os.PathLike):
+    """
+    Write the counts to `path` in the format `pstats.Stats` reads, one entry per (type, attribute).
+    """
+
+    stats = {
+        (label, 0, key): (row["calls"], row["calls"], row["seconds"] or 0.0, row["seconds"] or 0.0, {})
+        for (label, key), row in report().items()
+    }
+
+    with open(path, "wb") as f:
+        marshal.dump(stats, f)
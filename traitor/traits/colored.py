@@ -16,7 +16,7 @@ from functools import wraps
 from re import finditer
 from typing import Optional
 
-from .. import Trait, impl
+from .. import Trait, derived_impl, impl
 
 TrueColor = namedtuple("TrueColor", "r g b")
 
@@ -641,40 +641,45 @@ class Colorize(Trait):
 
     #@staticmethod
     def __derive__(klass):
-        @impl(Colorize >> klass)
-        class ColorizeDerive:
-            def color(self, color: Color) -> ColoredString:
-                return ColoredString(str(self), fg_color=color)
+        methods = {name: method for name, method in vars(ColorizeDerived).items() if not name.startswith("__")}
 
-            def on_color(self, color: Color) -> ColoredString:
-                return ColoredString(str(self), bg_color=color)
+        return impl(Colorize >> klass)(derived_impl(Colorize, klass, f"Colorize{klass.__name__}Derived", methods))
 
-            def clear(self) -> ColoredString:
-                return ColoredString(str(self), style=Styles.Clear)
 
-            def bold(self) -> ColoredString:
-                return ColoredString(str(self)).bold()
+# What `derive(Colorize)` implements, the methods color the value's `str()`
+class ColorizeDerived:
+    def color(self, color: Color) -> ColoredString:
+        return ColoredString(str(self), fg_color=color)
+
+    def on_color(self, color: Color) -> ColoredString:
+        return ColoredString(str(self), bg_color=color)
+
+    def clear(self) -> ColoredString:
+        return ColoredString(str(self), style=Styles.Clear)
+
+    def bold(self) -> ColoredString:
+        return ColoredString(str(self)).bold()
 
-            def dimmed(self) -> ColoredString:
-                return ColoredString(str(self)).dimmed()
+    def dimmed(self) -> ColoredString:
+        return ColoredString(str(self)).dimmed()
 
-            def italic(self) -> ColoredString:
-                return ColoredString(str(self)).italic()
+    def italic(self) -> ColoredString:
+        return ColoredString(str(self)).italic()
 
-            def underline(self) -> ColoredString:
-                return ColoredString(str(self)).underline()
+    def underline(self) -> ColoredString:
+        return ColoredString(str(self)).underline()
 
-            def blink(self) -> ColoredString:
-                return ColoredString(str(self)).blink()
+    def blink(self) -> ColoredString:
+        return ColoredString(str(self)).blink()
 
-            def reversed(self) -> ColoredString:
-                return ColoredString(str(self)).reversed()
+    def reversed(self) -> ColoredString:
+        return ColoredString(str(self)).reversed()
 
-            def hidden(self) -> ColoredString:
-                return ColoredString(str(self)).hidden()
+    def hidden(self) -> ColoredString:
+        return ColoredString(str(self)).hidden()
 
-            def strikethrough(self) -> ColoredString:
-                return ColoredString(str(self)).strikethrough()
+    def strikethrough(self) -> ColoredString:
+        return ColoredString(str(self)).strikethrough()
 
 
 @impl(Colorize >> ColoredString)
@@ -12,7 +12,7 @@ from inspect import getmembers, isclass, isroutine, signature
 from textwrap import indent
 from types import BuiltinFunctionType, FunctionType, MappingProxyType, MethodType
 
-from .. import Trait, TraitObject, TraitMeta, impl
+from .. import Trait, TraitObject, TraitMeta, derived_impl, impl, published_names
 
 
 class Debug(Trait):
@@ -29,10 +29,12 @@ class Debug(Trait):
 
         def fmt(self):
             buf = [f"{msg}:"]
+            # trait methods sit on the class too, they aren't part of it
+            traits = published_names(type(self))
 
             data = tuple(
                 filter(
-                    lambda p: not p[0].startswith("_"),
+                    lambda p: not p[0].startswith("_") and p[0] not in traits,
                     sorted(getmembers(self), key=lambda p: 1 if isroutine(p[1]) else 0),
                 )
             )
@@ -48,7 +50,7 @@ class Debug(Trait):
 
             return "\n".join(buf)
 
-        return impl(Debug >> klass)(type(f"Debug{klass.__name__}Derived", (object,), {"fmt": fmt}))
+        return impl(Debug >> klass)(derived_impl(Debug, klass, f"Debug{klass.__name__}Derived", {"fmt": fmt}))
 
 
 def check_indent(text, n=2):
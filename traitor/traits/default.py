@@ -8,9 +8,10 @@ from __future__ import annotations
 
 __all__ = ("Default",)
 
-from .. import Trait, impl, has_trait
+from .. import Trait, derived_impl, impl, has_trait
 
 import inspect
+import weakref
 
 
 def parameter_predicate(param: inspect.Parameter):
@@ -55,8 +56,13 @@ class Default(Trait):
 
         bound = signature.bind_partial(*args, **kwargs)
 
+        # held weakly, the impl must not keep `klass` alive
+        klass_ref = weakref.ref(klass)
+
         return impl(Default >> klass)(
-            type(f"Default{klass.__name__}Derived", (object,), {"default": lambda: klass(*bound.args, **bound.kwargs)})
+            derived_impl(
+                Default, klass, f"Default{klass.__name__}Derived", {"default": lambda: klass_ref()(*bound.args, **bound.kwargs)}
+            )
         )
 
 
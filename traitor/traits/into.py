@@ -8,29 +8,38 @@ from __future__ import annotations
 
 __all__ = ("From", "Into")
 
-from .. import Trait, impl
+import weakref
+
+from .. import Trait, derived_impl, impl
 
 class From(Trait):
+    # held weakly like the arguments themselves, a `From[source]` impl must not keep `source` alive
     def __generic__(cls, source: type):
-        cls.source = source
+        cls.source = weakref.ref(source)
 
         return [source] # TODO: make this neater
 
     def __reciprocal__(cls, ty):
-        impl(Into[ty] >> cls.source)(
-            type(f"Auto{cls.source.__name__.title()}Into{ty.__name__.title()}", tuple(), {}))
+        source = cls.source()
+
+        impl(Into[ty] >> source)(
+            derived_impl(Into[ty], source, f"Auto{source.__name__.title()}Into{ty.__name__.title()}", {}, reciprocal))
 
     def from_(val): ...
 
+# Recipe for the impl `From.__reciprocal__` derives, see `derived_impl`
+def reciprocal(trait, source: type):
+    From.__reciprocal__(From[source], trait.target())
+
 class Into(Trait):
     def __generic__(cls, target: type):
-        cls.target = target
+        cls.target = weakref.ref(target)
 
         return [target]
 
     @classmethod
     def into(cls, val):
-        return From[val.__class__](cls.target).from_(val)
+        return From[val.__class__](cls.target()).from_(val)
 
 
 
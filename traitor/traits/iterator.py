@@ -14,7 +14,7 @@ import operator
 from collections import deque
 from functools import reduce
 
-from .. import Trait, impl
+from .. import Trait, impl_many
 
 
 class AdvancedIterator(Trait):
@@ -193,151 +193,38 @@ class AdvancedIterator(Trait):
             yield chunk
 
 
-@impl(AdvancedIterator >> list)
-class AIList:
-    ...
-
-
-@impl(AdvancedIterator >> str)
-class AIStr:
-    ...
-
-
-@impl(AdvancedIterator >> map)
-class AIMap:
-    ...
-
-
-@impl(AdvancedIterator >> filter)
-class AIFilter:
-    ...
-
-
-@impl(AdvancedIterator >> enumerate)
-class AIEnumerate:
-    ...
-
-
-@impl(AdvancedIterator >> reversed)
-class AIReversed:
-    ...
-
-
-@impl(AdvancedIterator >> tuple)
-class AITuple:
-    ...
-
-
-@impl(AdvancedIterator >> builtins.range)
-class AIRange:
-    ...
-
-
-@impl(AdvancedIterator >> (x for x in "").__class__)
-class AIGenerator:
-    ...
-
-
-@impl(AdvancedIterator >> iter([1]).__class__)
-class AIListIter:
-    ...
-
-
-@impl(AdvancedIterator >> iter("a").__class__)
-class AIStrIter:
-    ...
-
-
-@impl(AdvancedIterator >> iter(range(0)).__class__)
-class AIRangeIter:
-    ...
-
-
-@impl(AdvancedIterator >> builtins.zip)
-class AIZip:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.accumulate)
-class AIAccumulate:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.chain)
-class AIChain:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.combinations)
-class AICombinations:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.compress)
-class AICompress:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.dropwhile)
-class AIDropWhile:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.filterfalse)
-class AIFilterFalse:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.groupby)
-class AIGroupBy:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.islice)
-class AIIslice:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.permutations)
-class AIPermutations:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.product)
-class AIProduct:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.starmap)
-class AIStarmap:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.takewhile)
-class AITakeWhile:
-    ...
-
-
-@impl(AdvancedIterator >> itertools._tee)
-class AITee:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.zip_longest)
-class AIZipLongest:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.count)
-class AICount:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.cycle)
-class AICycle:
-    ...
-
-
-@impl(AdvancedIterator >> itertools.repeat)
-class AIRepeat:
-    ...
+impl_many(
+    AdvancedIterator,
+    [
+        list,
+        str,
+        map,
+        filter,
+        enumerate,
+        reversed,
+        tuple,
+        builtins.range,
+        (x for x in "").__class__,
+        iter([1]).__class__,
+        iter("a").__class__,
+        iter(range(0)).__class__,
+        builtins.zip,
+        itertools.accumulate,
+        itertools.chain,
+        itertools.combinations,
+        itertools.compress,
+        itertools.dropwhile,
+        itertools.filterfalse,
+        itertools.groupby,
+        itertools.islice,
+        itertools.permutations,
+        itertools.product,
+        itertools.starmap,
+        itertools.takewhile,
+        itertools._tee,
+        itertools.zip_longest,
+        itertools.count,
+        itertools.cycle,
+        itertools.repeat,
+    ],
+)